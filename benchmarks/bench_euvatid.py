@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        bench_euvatid
+# Purpose:     Benchmark validation of EU VAT ids
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Benchmark validation of EU VAT ids
+
+Measures the latency per VAT id of classifying the registration code by
+the combined pattern of its country, compared to trying the patterns of the
+country one after the other (as done up to version 0.4), as well as the
+latency of constructing an EUVATId with both variants and of validating the
+whole sample by `EUVATId.validate_many`, which groups the VAT ids by country
+code, compared to validating them one by one.
+
+Usage:
+
+    python bench_euvatid.py [-n NUMBER] [-i INVALID]
+
+The sample consists of NUMBER VAT ids (default: 100000) from all member
+states, a share of INVALID (default: 0.1) of them with a random character
+replaced.
+"""
+
+
+# standard library imports
+from argparse import ArgumentParser
+from random import Random
+from string import ascii_uppercase, digits
+from timeit import default_timer
+from typing import Callable, List, Optional
+
+# local imports
+from identifiers.euvatid import (
+    _VAT_ID_RULES, EUVATId, _get_dispatch, get_first_match,
+)
+
+
+EXAMPLES = [
+    'ATU13585627', 'BE0776091951', 'BE1151113846', 'BG7523169263',
+    'BG0542011038', 'BG123456786', 'CY12345678F', 'CZ5502080001',
+    'CZ110101111', 'CZ6852294449', 'CZ12345679', 'DE136695976',
+    'DK13585628', 'EE123456780', 'EL123456783', 'ESA12345674',
+    'ESP1234567D', 'ES12345678Z', 'ESK1234567L', 'FI09853608',
+    'FR32123456789', 'FR2H123456789', 'GB434031494', 'GB123456727872',
+    'HR12345678903', 'HU21376414', 'IE8Z49289F', 'IE3628739L',
+    'IE3628739UA', 'IT12345670017', 'LT213179412', 'LT290061371314',
+    'LU10000356', 'LV41234567891', 'LV15066312345', 'MT12345634',
+    'NL123456782B70', 'PL5260001246', 'PT502757191', 'RO1234567897',
+    'RO1630615123457', 'SE556188840494', 'SI15012557', 'SK4030000007',
+]
+
+
+class EUVATIdSequential(EUVATId):
+
+    """EUVATId validated by trying the patterns of the country one after
+    the other (former implementation)."""
+
+    __slots__ = ()
+
+    # noinspection PyMissingConstructor
+    def __init__(self, vat_id: str) -> None:
+        if not isinstance(vat_id, str):
+            raise TypeError("Argument must be an instance of 'str'.")
+        vat_id = vat_id.strip().upper()
+        country_code = vat_id[:2]
+        try:
+            rules = _VAT_ID_RULES[country_code]
+        except KeyError:
+            msg = f"Unknown country code: '{country_code}'"
+        else:
+            reg_code = vat_id[2:]
+            match, check = get_first_match(rules, reg_code)
+            if match and match.end() == len(reg_code):
+                if (check is None or
+                        check(match.group('base'),
+                              match.groupdict().get('add')) ==
+                        match.groupdict().get('check', '')):
+                    self._id = vat_id
+                    return
+                else:
+                    msg = f"'{reg_code}' does not pass the checks for " \
+                          f"'{country_code}'."
+            else:
+                msg = f"'{reg_code}' does not match the " \
+                      f"pattern{'' if len(rules) == 1 else 's'} " \
+                      f"for '{country_code}': " \
+                      f"'{' | '.join((p.pattern for p, _ in rules))}'."
+        raise ValueError(msg)
+
+
+def random_vat_ids(n_ids: int, invalid: float) -> List[str]:
+    """Return `n_ids` VAT ids, a share of `invalid` of them modified."""
+    rnd = Random(4711)
+    vat_ids = []
+    for _ in range(n_ids):
+        vat_id = rnd.choice(EXAMPLES)
+        if rnd.random() < invalid:
+            idx = rnd.randrange(2, len(vat_id))
+            vat_id = vat_id[:idx] + rnd.choice(digits + ascii_uppercase) + \
+                vat_id[idx + 1:]
+        vat_ids.append(vat_id)
+    return vat_ids
+
+
+def classify_sequential(vat_ids: List[str]) -> None:
+    """Classify registration codes by trying the patterns one by one."""
+    for vat_id in vat_ids:
+        get_first_match(_VAT_ID_RULES[vat_id[:2]], vat_id[2:])
+
+
+def classify_combined(vat_ids: List[str]) -> None:
+    """Classify registration codes by the combined patterns."""
+    for vat_id in vat_ids:
+        pattern, branches = _get_dispatch(vat_id[:2])
+        match = pattern.match(vat_id[2:])
+        if match:
+            branches[match.lastindex]
+
+
+def _construct(cls: type, vat_ids: List[str]) -> Callable[[], None]:
+
+    def run() -> None:
+        for vat_id in vat_ids:
+            try:
+                cls(vat_id)
+            except ValueError:
+                pass
+
+    return run
+
+
+def validate_one_by_one(vat_ids: List[str]) -> List[Optional[str]]:
+    """Validate VAT ids one by one by the constructor."""
+    results = []
+    for vat_id in vat_ids:
+        try:
+            EUVATId(vat_id)
+        except ValueError:
+            results.append('invalid')
+        else:
+            results.append(None)
+    return results
+
+
+def _timed(func: Callable[[], object], repeat: int = 7) -> float:
+    """Return minimal time in seconds needed by `func`."""
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        func()
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def main(n_ids: int, invalid: float) -> None:
+    """Run the benchmark."""
+    vat_ids = random_vat_ids(n_ids, invalid)
+    for vat_id in EXAMPLES:
+        assert str(EUVATIdSequential(vat_id)) == str(EUVATId(vat_id))
+    assert [res is None for res in EUVATId.validate_many(vat_ids)] == \
+        [res is None for res in validate_one_by_one(vat_ids)]
+    # pairs of (former, new) variants
+    cases = [
+        (('classify (sequential)', lambda: classify_sequential(vat_ids)),
+         ('classify (combined)', lambda: classify_combined(vat_ids))),
+        (('EUVATId (sequential)', _construct(EUVATIdSequential, vat_ids)),
+         ('EUVATId (combined)', _construct(EUVATId, vat_ids))),
+        (('validate (one by one)', lambda: validate_one_by_one(vat_ids)),
+         ('validate_many', lambda: EUVATId.validate_many(vat_ids))),
+    ]
+    print(f"{n_ids} VAT ids, {invalid:.0%} invalid, best of 7 runs")
+    for pair in cases:
+        timings = []
+        for name, func in pair:
+            elapsed = _timed(func)
+            timings.append(elapsed)
+            print(f"{name:<25s} {elapsed:8.3f} s "
+                  f"{elapsed / n_ids * 1e6:8.3f} µs/id")
+        print(f"{'speedup':<25s} {timings[0] / timings[1]:7.2f}x")
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Benchmark validation of EU VAT "
+                                        "ids")
+    parser.add_argument('-n', '--number', type=int, default=100000,
+                        help="number of VAT ids (default: 100000)")
+    parser.add_argument('-i', '--invalid', type=float, default=0.1,
+                        help="share of invalid VAT ids (default: 0.1)")
+    args = parser.parse_args()
+    main(args.number, args.invalid)
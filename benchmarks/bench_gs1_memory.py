@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        bench_gs1_memory
+# Purpose:     Benchmark per-process memory used by the GS1 prefix table
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Benchmark per-process memory used by the GS1 prefix table
+
+Starts a number of worker processes for each way of holding the GS1 company
+prefix table ('xml': list of tuples parsed from the XML file, as done up to
+version 0.4; 'memory' and 'mmap': the backends of `gs1utils`), lets each
+worker load the table and do some lookups and reports the memory added per
+worker.
+
+Memory is measured as proportional set size (PSS) and private memory
+(USS), taken from /proc/self/smaps_rollup (so, Linux only). Pages of a
+memory-mapped file are shared between all workers, so they add to PSS only
+a fraction and nothing to USS.
+
+Usage:
+
+    python bench_gs1_memory.py [-w WORKERS]
+
+WORKERS is the number of worker processes per backend (default: 8).
+"""
+
+
+# standard library imports
+from argparse import ArgumentParser
+from multiprocessing import get_context
+import random
+from typing import Dict
+
+# local imports
+from identifiers import gs1utils
+
+
+N_LOOKUPS = 10000
+
+
+def _proc_mem() -> Dict[str, int]:
+    """Return PSS and USS of current process in kB (0 if not available)."""
+    mem = {'pss': 0, 'uss': 0}
+    try:
+        with open('/proc/self/smaps_rollup') as file:
+            for line in file:
+                key, val = line.split(':')
+                if key == 'Pss':
+                    mem['pss'] = int(val.split()[0])
+                elif key in ('Private_Clean', 'Private_Dirty'):
+                    mem['uss'] += int(val.split()[0])
+    except OSError:
+        pass
+    return mem
+
+
+def _worker(backend: str, barrier, results) -> None:
+    prefixes = [str(random.randrange(10 ** 12)).zfill(12)
+                for _ in range(N_LOOKUPS)]
+    before = _proc_mem()
+    if backend == 'xml':
+        # reference: table held as list of tuples (str, int)
+        table = gs1utils._load_prefix_list()
+    else:
+        gs1utils.set_backend(backend)
+        gs1utils.preload()
+        table = gs1utils._prefix_table
+    for prefix in prefixes:
+        try:
+            gs1utils.lookup_company_prefix(prefix)
+        except ValueError:
+            pass
+    # wait until all workers have loaded the table, so that PSS reflects
+    # the sharing of pages
+    barrier.wait()
+    after = _proc_mem()
+    del table
+    results.put({'pss': after['pss'] - before['pss'],
+                 'uss': after['uss'] - before['uss']})
+
+
+def main(n_workers: int) -> None:
+    """Run benchmark for all backends with `n_workers` processes each."""
+    # make sure the binary file exists before starting the workers
+    gs1utils.preload()
+    ctx = get_context('spawn')
+    print(f"Memory per worker process ({n_workers} workers, in kB):")
+    print(f"{'backend':<10}{'PSS':>10}{'USS':>10}")
+    for backend in ('xml', 'memory', 'mmap'):
+        barrier = ctx.Barrier(n_workers)
+        queue = ctx.Queue()
+        workers = [ctx.Process(target=_worker,
+                               args=(backend, barrier, queue))
+                   for _ in range(n_workers)]
+        for worker in workers:
+            worker.start()
+        results = [queue.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+        avg = {key: sum(res[key] for res in results) // n_workers
+               for key in ('pss', 'uss')}
+        print(f"{backend:<10}{avg['pss']:>10}{avg['uss']:>10}")
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Benchmark per-process memory used "
+                                        "by the GS1 prefix table")
+    parser.add_argument('-w', '--workers', type=int, default=8,
+                        help="number of worker processes per backend "
+                             "(default: 8)")
+    args = parser.parse_args()
+    main(args.workers)
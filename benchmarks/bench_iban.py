@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        bench_iban
+# Purpose:     Benchmark calculation of IBAN check digits
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Benchmark calculation of IBAN check digits
+
+Compares the mod-97 engine in module ibanutils with the former
+implementation, which converted the whole IBAN into one big integer, and
+measures the batch functions.
+
+Usage:
+
+    python bench_iban.py [-n NUMBER]
+
+The sample consists of the examples from the IBAN registry, repeated so
+that it contains at least NUMBER IBANs (default: 100000).
+"""
+
+
+# standard library imports
+from argparse import ArgumentParser
+from string import ascii_uppercase, digits
+from timeit import default_timer
+from typing import Callable, List, Sequence
+
+# local imports
+from identifiers.ibanregistry import IBAN_REGISTRY
+from identifiers.ibanutils import (
+    calc_iban_check_digits, check_iban_check_digits_array,
+    check_iban_check_digits_many, split_iban,
+)
+
+
+_ALPHABET = digits + ascii_uppercase
+
+
+def calc_iban_check_digits_bignum(country_code: str, bban: str) -> str:
+    """Former implementation of `calc_iban_check_digits`."""
+    string = bban.upper() + country_code + '00'
+    check_num = int(''.join((str(_ALPHABET.index(char))
+                             for char in string)))
+    return '%02i' % (98 - check_num % 97)
+
+
+def _per_iban(calc: Callable[[str, str], str],
+              ibans: Sequence[str]) -> Callable[[], None]:
+
+    def run() -> None:
+        for iban in ibans:
+            country_code, check_digits, bban = split_iban(iban)
+            calc(country_code, bban) == check_digits
+
+    return run
+
+
+def _timed(func: Callable[[], object], repeat: int = 3) -> float:
+    """Return minimal time in seconds needed by `func`."""
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        func()
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def main(n_ibans: int) -> None:
+    """Run the benchmark."""
+    examples: List[str] = [exmpl for spec in IBAN_REGISTRY.values()
+                           for exmpl in spec.examples]
+    ibans = examples * (-(-n_ibans // len(examples)))
+    for exmpl in examples:
+        country_code, _, bban = split_iban(exmpl)
+        assert calc_iban_check_digits(country_code, bban) == \
+            calc_iban_check_digits_bignum(country_code, bban)
+    cases = [
+        ('calc_iban_check_digits (bignum)',
+         _per_iban(calc_iban_check_digits_bignum, ibans)),
+        ('calc_iban_check_digits',
+         _per_iban(calc_iban_check_digits, ibans)),
+        ('check_iban_check_digits_many',
+         lambda: check_iban_check_digits_many(ibans)),
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        array = np.array(ibans, dtype='S34')
+        cases.append(('check_iban_check_digits_array',
+                      lambda: check_iban_check_digits_array(array)))
+    print(f"{len(ibans)} IBANs")
+    for name, func in cases:
+        elapsed = _timed(func)
+        print(f"{name:<35s} {elapsed:8.3f} s "
+              f"{elapsed / len(ibans) * 1e6:8.3f} µs/IBAN")
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Benchmark calculation of IBAN "
+                                        "check digits")
+    parser.add_argument('-n', '--number', type=int, default=100000,
+                        help="minimal number of IBANs (default: 100000)")
+    main(parser.parse_args().number)
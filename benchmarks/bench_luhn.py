@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        bench_luhn
+# Purpose:     Benchmark calculation of Luhn check digits
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Benchmark calculation of Luhn check digits
+
+Measures the latency per call of the Luhn algorithm for the first 11
+characters of 12-character ISINs, compared to the former implementation,
+which searched the alphabet for each character, as well as the latency of
+ISIN.calc_check_digit and of the vectorized variant per ISIN.
+
+Usage:
+
+    python bench_luhn.py [-n NUMBER]
+
+The sample consists of NUMBER random ISINs (default: 100000).
+"""
+
+
+# standard library imports
+from argparse import ArgumentParser
+from random import Random
+from string import ascii_uppercase, digits
+from timeit import default_timer
+from typing import Callable, List, Optional
+
+# local imports
+from identifiers.finance import ISIN
+from identifiers.luhn import _PRE_CALC, luhn, luhn_array
+
+
+_ALPHABET = digits + ascii_uppercase
+
+
+def luhn_index(base: str, num_only: Optional[bool] = False,
+               allow_lower_case: Optional[bool] = False) -> int:
+    """Former implementation of `luhn`."""
+    if num_only:
+        alphabet = _ALPHABET[:10]
+    else:
+        alphabet = _ALPHABET
+    if allow_lower_case:
+        base = base.upper()
+    try:
+        pre_calc = (_PRE_CALC[alphabet.index(c)] for c in reversed(base))
+        cum = 0
+        parity = 1
+        for elem in pre_calc:
+            val, parity = elem[parity]
+            cum += val
+    except ValueError:
+        pass    # fall through
+    else:
+        return 10 - cum % 10
+    raise ValueError("Unallowed character.")
+
+
+def random_isins(n_isins: int) -> List[str]:
+    """Return `n_isins` random ISINs."""
+    rnd = Random(4711)
+    country_codes = ('US', 'DE', 'GB', 'FR', 'CH', 'JP', 'LU', 'IE')
+    nsin_chars = digits * 4 + ascii_uppercase
+    isins = []
+    for _ in range(n_isins):
+        base = rnd.choice(country_codes) + \
+            ''.join(rnd.choice(nsin_chars) for _ in range(9))
+        isins.append(base + str(luhn(base) % 10))
+    return isins
+
+
+def _timed(func: Callable[[], object], repeat: int = 3) -> float:
+    """Return minimal time in seconds needed by `func`."""
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        func()
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def main(n_isins: int) -> None:
+    """Run the benchmark."""
+    isins = random_isins(n_isins)
+    bases = [isin[:11] for isin in isins]
+    assert all(luhn(base) == luhn_index(base) for base in bases)
+    cases = [
+        ('luhn (alphabet.index)',
+         lambda: [luhn_index(base) for base in bases]),
+        ('luhn',
+         lambda: [luhn(base) for base in bases]),
+        ('ISIN.calc_check_digit',
+         lambda: [ISIN.calc_check_digit(isin[:2], isin[2:11])
+                  for isin in isins]),
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        array = np.array(bases, dtype='S11')
+        cases.append(('luhn_array',
+                      lambda: luhn_array(array)))
+    print(f"{len(isins)} ISINs")
+    for name, func in cases:
+        elapsed = _timed(func)
+        print(f"{name:<25s} {elapsed:8.3f} s "
+              f"{elapsed / len(isins) * 1e6:8.3f} µs/ISIN")
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Benchmark calculation of Luhn "
+                                        "check digits")
+    parser.add_argument('-n', '--number', type=int, default=100000,
+                        help="number of ISINs (default: 100000)")
+    main(parser.parse_args().number)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        bench_prefix_cache
+# Purpose:     Benchmark memoized prefix lookups
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Benchmark memoized prefix lookups
+
+Measures the latency per call of `lookup_company_prefix` with the prefix
+cache enabled (default size) and disabled, compared to the former
+implementation, and reports the hit rate of the cache. For comparison, the
+latency of `lookup_isbn_prefix` and `lookup_ismn_prefix`, which are not
+memoized, is measured together with their former implementations.
+
+Usage:
+
+    python bench_prefix_cache.py [-n NUMBER] [-p PREFIXES]
+
+The sample consists of NUMBER identifiers (default: 100000), drawn from
+PREFIXES different company prefixes or registrants (default: 2000) with a
+skewed distribution, as seen in real data.
+"""
+
+
+# standard library imports
+from argparse import ArgumentParser
+from bisect import bisect
+from random import Random
+from string import digits as digits_alphabet
+from timeit import default_timer
+from typing import Callable, List, Tuple
+
+# local imports
+from identifiers import gs1utils, isbnutils, ismnutils
+from identifiers.bookland import ISBN, ISMN
+from identifiers.gs1 import GTIN13
+
+
+def lookup_company_prefix_trie(gs1_num_id: str) -> int:
+    """Former implementation of `lookup_company_prefix`."""
+    res = gs1utils._get_prefix_table().find(gs1_num_id)
+    if res is None:
+        raise ValueError("Undefined prefix.")
+    prefix, cp_length = res
+    if cp_length > 0:
+        return cp_length
+    raise ValueError(f"Excluded prefix: '{prefix}'.")
+
+
+def lookup_isbn_prefix_bisect(digits: str) -> Tuple[int, int]:
+    """Former implementation of `lookup_isbn_prefix`, applying the range
+    bounds to the whole digit string."""
+    rule_list = isbnutils.rule_list
+    idx = max(bisect(rule_list, (digits,)) - 1, 0)
+    lower_prefix, upper_prefix, registrant_idx, item_idx = rule_list[idx]
+    if lower_prefix <= digits <= upper_prefix:
+        if item_idx > 0:
+            return registrant_idx, item_idx
+        raise ValueError(f"Excluded prefix range: '{lower_prefix}' - "
+                         f"'{upper_prefix}'.")
+    if lower_prefix[:3] != digits[:3]:
+        raise ValueError("Undefined prefix.")
+    raise ValueError("Undefined registration group or registrant.")
+
+
+def lookup_ismn_prefix_bisect(digits: str) -> Tuple[int, int]:
+    """Former implementation of `lookup_ismn_prefix`, applying the range
+    bounds to the whole digit string."""
+    rule_list = ismnutils.rule_list
+    idx = bisect(rule_list, (digits,)) - 1
+    lower_prefix, upper_prefix, registrant_idx, item_idx = rule_list[idx]
+    if lower_prefix <= digits <= upper_prefix:
+        return registrant_idx, item_idx
+    raise ValueError("ISMN prefix must be '9790'.")
+
+
+# leading digits of the identifiers in the sample
+_HEADS = {
+    GTIN13: ('',),
+    ISBN: ('978', '979'),
+    ISMN: ('9790',),
+}
+
+
+def random_digits(rnd: Random, cls: type, n_ids: int,
+                  n_prefixes: int) -> List[str]:
+    """Return `n_ids` valid digit strings of `cls` without check digit,
+    sharing `n_prefixes` company prefixes (or registrants)."""
+    prefixes = []
+    while len(prefixes) < n_prefixes:
+        head = rnd.choice(_HEADS[cls])
+        digits = head + ''.join(rnd.choice(digits_alphabet)
+                                for _ in range(12 - len(head)))
+        try:
+            id = cls(digits)
+        except ValueError:
+            continue
+        prefixes.append(digits[:id._ref_idx])
+    # Zipf-like distribution of the prefixes
+    weights = [1 / rank for rank in range(1, n_prefixes + 1)]
+    return [prefix + ''.join(rnd.choice(digits_alphabet)
+                             for _ in range(12 - len(prefix)))
+            for prefix in rnd.choices(prefixes, weights, k=n_ids)]
+
+
+def _run(lookup: Callable[[str], object],
+         sample: List[str]) -> Callable[[], None]:
+
+    def run() -> None:
+        for digits in sample:
+            try:
+                lookup(digits)
+            except ValueError:
+                pass
+
+    return run
+
+
+def _timed(func: Callable[[], object], repeat: int = 3) -> float:
+    """Return minimal time in seconds needed by `func`."""
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        func()
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def main(n_ids: int, n_prefixes: int) -> None:
+    """Run the benchmark."""
+    rnd = Random(4711)
+    gs1utils.preload()
+    cases = [
+        (GTIN13, gs1utils.company_prefix_cache, lookup_company_prefix_trie,
+         gs1utils.lookup_company_prefix),
+        (ISBN, None, lookup_isbn_prefix_bisect,
+         isbnutils.lookup_isbn_prefix),
+        (ISMN, None, lookup_ismn_prefix_bisect,
+         ismnutils.lookup_ismn_prefix),
+    ]
+    print(f"{n_ids} identifiers, {n_prefixes} prefixes")
+    for cls, cache, former, lookup in cases:
+        sample = random_digits(rnd, cls, n_ids, n_prefixes)
+        variants = [(former.__name__, former, None)]
+        if cache is None:
+            variants.append((lookup.__name__, lookup, None))
+        else:
+            variants.append((f"{lookup.__name__} (no cache)", lookup, 0))
+            variants.append((lookup.__name__, lookup, cache.maxsize))
+        for name, func, maxsize in variants:
+            if maxsize is not None:
+                cache.resize(maxsize)
+                cache.clear()
+            elapsed = _timed(_run(func, sample))
+            print(f"{name:<35s} {elapsed:8.3f} s "
+                  f"{elapsed / n_ids * 1e6:8.3f} µs/id")
+        if cache is not None:
+            print(f"{'hit rate':<35s} {cache.hit_rate():8.1%}")
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Benchmark memoized prefix lookups")
+    parser.add_argument('-n', '--number', type=int, default=100000,
+                        help="number of identifiers (default: 100000)")
+    parser.add_argument('-p', '--prefixes', type=int, default=2000,
+                        help="number of prefixes (default: 2000)")
+    args = parser.parse_args()
+    main(args.number, args.prefixes)
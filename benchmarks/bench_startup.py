@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        bench_startup
+# Purpose:     Benchmark import time, cold start and memory of registries
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Benchmark import time, cold start and memory of registries
+
+Each measurement is done in a fresh interpreter process, so that nothing is
+cached in the process:
+
+import:     time needed to import a module of package `identifiers`
+            (including the modules it depends on)
+first:      time needed to construct the first instance of an identifier
+            class (including importing its module and loading registries)
+memory:     memory allocated by the Python interpreter for loading a
+            registry (current and peak, measured by tracemalloc)
+
+Usage:
+
+    python bench_startup.py [-r REPEAT] [--save FILE] [--compare [FILE]]
+
+Results can be saved as JSON file and later be compared to the results of
+another run, for example of a new release, in order to detect regressions.
+
+The baseline of the current release is kept in `startup_baseline.json` next
+to this script and is used by `--compare` if no file is given. It is
+regenerated for each release by
+
+    python bench_startup.py -r 7 --save startup_baseline.json
+
+(its first entry records the Python implementation and version used).
+"""
+
+
+# standard library imports
+from argparse import ArgumentParser
+import json
+import os
+import platform
+from statistics import median
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'startup_baseline.json')
+
+MODULES = (
+    'identifiers',
+    'identifiers.identifier',
+    'identifiers.luhn',
+    'identifiers.gs1utils',
+    'identifiers.gs1',
+    'identifiers.isbnutils',
+    'identifiers.ismnutils',
+    'identifiers.bookland',
+    'identifiers.ibanregistry',
+    'identifiers.ibanutils',
+    'identifiers.banking',
+    'identifiers.micutils',
+    'identifiers.finance',
+    'identifiers.euvatid',
+)
+
+FIRST_CONSTRUCTIONS = {
+    'GLN': ('identifiers.gs1', "GLN('5700191234561')"),
+    'GTIN13': ('identifiers.gs1', "GTIN13('5700271234566')"),
+    'ISBN': ('identifiers.bookland', "ISBN('978-982-114-123-9')"),
+    'ISMN': ('identifiers.bookland', "ISMN('979-0-1100-1234-5')"),
+    'ISSN': ('identifiers.bookland', "ISSN('0317-8471')"),
+    'BIC': ('identifiers.banking', "BIC('DEUTDEFF500')"),
+    'IBAN': ('identifiers.banking', "IBAN('DE89370400440532013000')"),
+    'MIC': ('identifiers.finance', "MIC('XNYS')"),
+    'ISIN': ('identifiers.finance', "ISIN('US0378331005')"),
+    'EUVATId': ('identifiers.euvatid', "EUVATId('DE136695976')"),
+}
+
+REGISTRIES = {
+    'gs1utils': "from identifiers import gs1utils; gs1utils.preload()",
+    'isbnutils': "import identifiers.isbnutils",
+    'ibanregistry': "import identifiers.ibanregistry",
+    'micutils': "import identifiers.micutils",
+}
+
+_TIMED_CODE = """
+from time import perf_counter
+{setup}
+start = perf_counter()
+{stmt}
+print(perf_counter() - start)
+"""
+
+_MEMORY_CODE = """
+import identifiers
+import tracemalloc
+tracemalloc.start()
+{stmt}
+current, peak = tracemalloc.get_traced_memory()
+print(current, peak)
+"""
+
+
+def _run(code: str) -> List[str]:
+    res = subprocess.run([sys.executable, '-c', code], check=True,
+                         stdout=subprocess.PIPE, universal_newlines=True)
+    return res.stdout.split()
+
+
+def _timed(setup: str, stmt: str, repeat: int) -> float:
+    code = _TIMED_CODE.format(setup=setup, stmt=stmt)
+    return median(float(_run(code)[0]) for _ in range(repeat))
+
+
+def bench_import(repeat: int) -> Dict[str, float]:
+    """Return median import time (in ms) per module."""
+    return {module: 1000 * _timed('', f"import {module}", repeat)
+            for module in MODULES}
+
+
+def bench_first_construction(repeat: int) -> Dict[str, float]:
+    """Return median time (in ms) for first construction per class."""
+    return {name: 1000 * _timed('import identifiers',
+                                f"from {module} import {name}; {stmt}",
+                                repeat)
+            for name, (module, stmt) in FIRST_CONSTRUCTIONS.items()}
+
+
+def bench_memory() -> Dict[str, Dict[str, int]]:
+    """Return memory (in kB) allocated for loading each registry."""
+    results = {}
+    for name, stmt in REGISTRIES.items():
+        current, peak = _run(_MEMORY_CODE.format(stmt=stmt))
+        results[name] = {'current': int(current) // 1024,
+                         'peak': int(peak) // 1024}
+    return results
+
+
+def run(repeat: int) -> Dict[str, Any]:
+    """Run all benchmarks."""
+    return {
+        'python': {
+            'implementation': platform.python_implementation(),
+            'version': platform.python_version(),
+        },
+        'import': bench_import(repeat),
+        'first': bench_first_construction(repeat),
+        'memory': bench_memory(),
+    }
+
+
+def _print_results(results: Dict[str, Any],
+                   baseline: Dict[str, Any] = None) -> None:
+
+    def line(section: str, key: str, val: float, unit: str) -> str:
+        text = f"  {key:<24}{val:>10.1f} {unit}"
+        if baseline:
+            try:
+                base_val = baseline[section][key]
+            except KeyError:
+                pass
+            else:
+                if section == 'memory':
+                    base_val = base_val['peak']
+                if base_val:
+                    text += f"{val / base_val:>10.2f} x baseline"
+        return text
+
+    python = results['python']
+    print(f"{python['implementation']} {python['version']}")
+    print("Import time:")
+    for key, val in results['import'].items():
+        print(line('import', key, val, 'ms'))
+    print("First construction:")
+    for key, val in results['first'].items():
+        print(line('first', key, val, 'ms'))
+    print("Memory for loading registries (peak):")
+    for key, val in results['memory'].items():
+        print(line('memory', key, val['peak'], 'kB'))
+
+
+def main() -> None:
+    """Run benchmarks as given by command line arguments."""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help="number of runs per measurement (default: 5)")
+    parser.add_argument('--save', metavar='FILE',
+                        help="save results as JSON to FILE")
+    parser.add_argument('--compare', metavar='FILE', nargs='?',
+                        const=BASELINE_FILE,
+                        help="compare results to baseline saved in FILE "
+                             "(default: baseline of the current release)")
+    args = parser.parse_args()
+    results = run(args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+    _print_results(results, baseline)
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
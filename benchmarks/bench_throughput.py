@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        bench_throughput
+# Purpose:     Benchmark constructions per second of identifier classes
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Benchmark constructions per second of identifier classes
+
+For each identifier class, the number of constructions per second is
+measured for valid and invalid input, given as single string and, where
+supported by the class, as separate elements. The registries are loaded
+before measuring.
+
+Usage:
+
+    python bench_throughput.py [-t MIN_TIME] [-o FILE] [CLASS ...]
+
+The results are written as JSON (to stdout or to FILE), including the
+Python implementation and version, so that they can be tracked over time
+and compared between CPython and PyPy.
+"""
+
+
+# standard library imports
+from argparse import ArgumentParser
+import json
+import platform
+import sys
+from timeit import default_timer
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+# local imports
+from identifiers import (BIC, EUVATId, GLN, GSIN, GTIN12, GTIN13, GTIN14,
+                         IBAN, ISBN, ISIN, ISMN, ISSN, MIC, SSCC)
+from identifiers.bookland import ISSN13
+
+
+ArgsType = Tuple[Any, ...]
+
+# For each class: valid string, invalid strings, valid elements and invalid
+# elements (None, if the class does not support the elements form).
+# Invalid input covers the typical failures: wrong check digit, wrong
+# length, unknown prefix or country code.
+SAMPLES: Dict[type, Tuple[Sequence[str], Sequence[str],
+                          Sequence[ArgsType], Sequence[ArgsType]]] = {
+    GLN: (
+        ('5700191234561', '5700271234566', '377912345678'),
+        ('5700191234562', '570019123456789', '0501234567891'),
+        (('5700191', '23456', '1'), ('5700271', '23456')),
+        (('5700191', '23456', '2'), ('569789', '123456')),
+    ),
+    GTIN12: (
+        ('077123456786', '07712345678'),
+        ('077123456787', '5700191234561', '569789123456'),
+        (('0771234', '5678', '6'), ('0771234', '5678')),
+        (('0771234', '5678', '7'), ('0771234', '56789')),
+    ),
+    GTIN13: (
+        ('5700271234566', '5700191234561', '570027123456'),
+        ('5700271234567', '57002712345', '9771234567898'),
+        (('5700271', '23456', '6'), ('5700271', '23456')),
+        (('5700271', '23456', '7'), ('977019', '123456')),
+    ),
+    GTIN14: (
+        ('40771234567895', '4077123456789'),
+        ('40771234567896', '157001912345678', '1569789123456'),
+        (('4', '0771234', '56789', '5'), ('4', '0771234', '56789')),
+        (('4', '0771234', '56789', '9'), ('40', '771234', '56789', '5')),
+    ),
+    SSCC: (
+        ('707712345678901232', '70771234567890123'),
+        ('707712345678901233', '8570789123456789019', '85697891234567890'),
+        (('7', '0771234', '567890123', '2'), ('7', '0771234', '567890123')),
+        (('7', '0771234', '567890123', '3'), ('7', '569789', '5678901234')),
+    ),
+    GSIN: (
+        ('07712345678901233', '0771234567890123'),
+        ('07712345678901234', '570789123456783', '56978912345789013'),
+        (('0771234', '567890123', '3'), ('0771234', '567890123')),
+        (('0771234', '567890123', '4'), ('569789', '1234567890')),
+    ),
+    ISBN: (
+        ('9783514123458', '978-982-114-123-9', '978 982 114 123'),
+        ('9783514123459', '978-982-114-123-8', '9773514123458'),
+        (('978', '3', '514', '12345', '8'), ('978', '982', '114', '123')),
+        (('978', '3', '514', '12345', '9'), ('978', '35', '14', '12345')),
+    ),
+    ISMN: (
+        ('9790110012345', '979-0-1100-1234-5', '979 0 1100 1234'),
+        ('9790110012346', '979-0-1100-1234-6', '9781100123455'),
+        (('979', '0', '1100', '1234', '5'), ('979', '0', '1100', '1234')),
+        (('979', '0', '1100', '1234', '6'), ('979', '0', '110', '01234')),
+    ),
+    ISSN: (
+        ('0317-8471', '03178471', '0317 847'),
+        ('0317-8472', '031784711', '0317/8471'),
+        None,
+        None,
+    ),
+    ISSN13: (
+        ('9770317847001', '0317-8471'),
+        ('9770317847002', '9780317847001'),
+        (('0317-8471', '00'), ('0317-8471', '15')),
+        (('0317-8471', '0'), ('0317-8472', '00')),
+    ),
+    BIC: (
+        ('DEUTDEFF500', 'ABCDBEB3XXX', 'ABCDBEB3'),
+        ('DEUTXXFF500', 'ABCDBEBBXX', 'abcdbebbxxx'),
+        None,
+        None,
+    ),
+    IBAN: (
+        ('DE89370400440532013000', 'MT84MALT011000012345MTLCAST001S'),
+        ('DE88370400440532013000', 'XX89370400440532013000',
+         'DE8937040044053201300'),
+        (('DE', '37040044', '0532013000'), ('DE', 37040044, 532013000)),
+        (('DE', '3704004', '0532013000'), ('XX', '37040044', '0532013000')),
+    ),
+    MIC: (
+        ('XNYS', 'XFRA', 'XLON'),
+        ('XYZQ', 'ABCDE'),
+        None,
+        None,
+    ),
+    ISIN: (
+        ('US0378331005', 'DE0005140008', 'GB0002634946'),
+        ('US0378331006', 'XX0378331005', 'US037833100'),
+        (('US', '037833100'), ('DE', '514000')),
+        (('XX', '037833100'), ('US', '0378331001')),
+    ),
+    EUVATId: (
+        ('ATU13585627', 'BE0776091951', 'DE136695976', 'ESA12345674',
+         'FR32123456789', 'GB434031494', 'IE3628739L', 'IT00000010215'),
+        ('ATU13585628', 'BE0776091952', 'DE136695977', 'ESA1234567',
+         'FR3212345678', 'GB434031495', 'XX123456789'),
+        None,
+        None,
+    ),
+}
+
+
+def _measure(func: Callable[[], None], n_calls: int,
+             min_time: float) -> float:
+    """Return number of calls per second of `func`, which does `n_calls`
+    calls per run."""
+    n_runs = 1
+    while True:
+        start = default_timer()
+        for _ in range(n_runs):
+            func()
+        elapsed = default_timer() - start
+        if elapsed >= min_time:
+            return n_runs * n_calls / elapsed
+        n_runs *= 2
+
+
+def _valid(cls: type, args_list: Sequence[ArgsType]) -> Callable[[], None]:
+
+    def run() -> None:
+        for args in args_list:
+            cls(*args)
+
+    return run
+
+
+def _invalid(cls: type,
+             args_list: Sequence[ArgsType]) -> Callable[[], None]:
+
+    def run() -> None:
+        for args in args_list:
+            try:
+                cls(*args)
+            except (TypeError, ValueError):
+                pass
+            else:
+                raise AssertionError(f"{cls.__name__}{args} is valid.")
+
+    return run
+
+
+def bench_class(cls: type, min_time: float) -> Dict[str, float]:
+    """Return constructions per second of `cls` for all kinds of input."""
+    single, single_invalid, elements, elements_invalid = SAMPLES[cls]
+    cases = {
+        'single/valid': _valid(cls, [(arg,) for arg in single]),
+        'single/invalid': _invalid(cls, [(arg,) for arg in single_invalid]),
+    }
+    n_calls = {
+        'single/valid': len(single),
+        'single/invalid': len(single_invalid),
+    }
+    if elements:
+        cases['elements/valid'] = _valid(cls, elements)
+        cases['elements/invalid'] = _invalid(cls, elements_invalid)
+        n_calls['elements/valid'] = len(elements)
+        n_calls['elements/invalid'] = len(elements_invalid)
+    # run each case once, so that registries are loaded and input is checked
+    for func in cases.values():
+        func()
+    return {case: round(_measure(func, n_calls[case], min_time))
+            for case, func in cases.items()}
+
+
+def run(classes: Sequence[type], min_time: float) -> Dict[str, Any]:
+    """Run benchmark for given `classes`."""
+    return {
+        'python': {
+            'implementation': platform.python_implementation(),
+            'version': platform.python_version(),
+        },
+        'unit': 'constructions/s',
+        'results': {cls.__name__: bench_class(cls, min_time)
+                    for cls in classes},
+    }
+
+
+def main() -> None:
+    """Run benchmark as given by command line arguments."""
+    classes = {cls.__name__: cls for cls in SAMPLES}
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-t', '--min-time', type=float, default=0.2,
+                        help="minimal time per measurement in seconds "
+                             "(default: 0.2)")
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help="write results to FILE instead of stdout")
+    parser.add_argument('classes', nargs='*', metavar='CLASS',
+                        help="identifier classes to benchmark (default: "
+                             "all)")
+    args = parser.parse_args()
+    for name in args.classes:
+        if name not in classes:
+            parser.error(f"unknown class: '{name}'")
+    selected = [classes[name] for name in args.classes] or list(SAMPLES)
+    results = run(selected, args.min_time)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,439 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        bench_vat_checks
+# Purpose:     Benchmark country specific checks of VAT ids
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Benchmark country specific checks of VAT ids
+
+Measures the latency per call of the table-driven check functions in module
+euvatid, compared to their former implementations based on generators.
+
+Usage:
+
+    python bench_vat_checks.py [-n NUMBER]
+
+For each check function, the sample consists of NUMBER (default: 20000)
+randomized bases.
+"""
+
+
+# standard library imports
+from argparse import ArgumentParser
+from itertools import chain
+from random import Random
+from string import ascii_uppercase, digits
+from timeit import default_timer
+from typing import Callable, List, Optional, Tuple
+
+# local imports
+from identifiers import euvatid
+from identifiers.dateutils import is_past_date, is_valid_date
+from identifiers.euvatid import _IE_CC_MAP
+
+
+# Former implementations of the check functions
+
+def check_at(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s1 = sum((int(c) for c in base[::2]))
+    s2 = sum(chain(*(divmod(2 * int(c), 10) for c in base[1::2])))
+    return str((96 - s1 - s2) % 10)
+
+
+def check_bg_9d(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (1, 2, 3, 4, 5, 6, 7, 8)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = s % 11
+    if r < 10:
+        return str(r)
+    weights = (3, 4, 5, 6, 7, 8, 9, 10)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = s % 11
+    return str(r % 10)
+
+
+def check_bg_ucn(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    year, month, day = int(base[:2]), int(base[2:4]), int(base[4:6])
+    if month < 20:
+        century = 1900
+    elif 20 <= month < 40:
+        month -= 20
+        century = 1800
+    else:
+        month -= 40
+        century = 2000
+    if not is_past_date(century + year, month, day):
+        return 'f'  # invalid ucn
+    weights = (2, 4, 8, 5, 10, 9, 7, 3, 6)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = s % 11
+    return str(r % 10)
+
+
+def check_bg_10d(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (21, 19, 17, 13, 11, 9, 7, 3, 1)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    return str(s % 10)
+
+
+def check_cy(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    ch_map = [1, 0, 5, 7, 9, 13, 15, 17, 19, 21]
+    s1 = sum((int(c) for c in base[1::2]))
+    s2 = sum((ch_map[int(c)] for c in base[::2]))
+    r = (s1 + s2) % 26
+    return chr(ord('A') + r)
+
+
+def check_cz_sp(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s = sum((8 - i) * int(c) for i, c in enumerate(base[1:]))
+    return str(9 - (11 - s % 11) % 10)
+
+
+def check_cz_8d(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s = sum((8 - i) * int(c) for i, c in enumerate(base))
+    return str((11 - s % 11) % 10)
+
+
+def check_dk(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (2, 7, 6, 5, 4, 3, 2, 1)
+    s = sum(int(c) * w for (c, w) in zip(base, weights))
+    r = s % 11
+    if r == 0:
+        return ''  # check ok
+    else:
+        return 'f'  # check failed
+
+
+def check_ee(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (3, 7, 1, 3, 7, 1, 3, 7)
+    s = sum(int(c) * w for (c, w) in zip(base, weights))
+    r = s % 10
+    if r == 0:
+        return '0'
+    else:
+        return str(10 - r)
+
+
+def check_es_prof(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s1 = sum(chain(*(divmod(2 * int(c), 10) for c in base[1::2])))
+    s2 = sum((int(c) for c in base[2::2]))
+    r = (s1 + s2) % 10
+    if r == 0:
+        return '0'
+    else:
+        return str(10 - r)
+
+
+def check_es_non_prof(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s1 = sum(chain(*(divmod(2 * int(c), 10) for c in base[1::2])))
+    s2 = sum((int(c) for c in base[2::2]))
+    i = 9 - (s1 + s2) % 10
+    return ascii_uppercase[i]
+
+
+def check_fi(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (7, 9, 10, 5, 8, 4, 2)
+    s = sum(int(c) * w for (c, w) in zip(base, weights))
+    r = s % 11
+    if r == 0:
+        return '0'
+    elif r == 1:
+        return ''  # invalid id
+    else:
+        return str(11 - r)
+
+
+def check_gb(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s = sum(int(c) * w for c, w in zip(base[:-2], range(8, 1, -1)))
+    cc = int(base[-2:])
+    r1 = 97 - s % 97
+    if r1 == cc:
+        return ''  # valid
+    if base[0] != '0':
+        r2 = 97 - (s + 55) % 97
+        if r2 == cc:
+            return ''  # valid
+    return 'f'  # check failed
+
+
+def check_gr(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s = sum(int(c) * 2 ** i for c, i in zip(base, range(len(base), 0, -1)))
+    return str((s % 11) % 10)
+
+
+def check_hu(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (9, 7, 3, 1, 9, 7, 3)
+    s = sum(int(c) * w for (c, w) in zip(base, weights))
+    r = s % 10
+    if r == 0:
+        return '0'
+    else:
+        return str(10 - r)
+
+
+def check_ie_v2(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s = sum(w * int(c) for w, c in zip(range(8, 1, -1), base))
+    i = s % 23
+    return _IE_CC_MAP[i]
+
+
+def check_ie_v3(base, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s = sum((w * int(c) for w, c in zip(range(8, 1, -1), base)),
+            9 * (ord(add) - ord('@')))  # 'A' - 'I' -> 1 - 9
+    i = s % 23
+    return _IE_CC_MAP[i]
+
+
+def check_it(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s1 = sum((int(c) for c in base[::2]))
+    s2 = sum(chain(*(divmod(2 * int(c), 10) for c in base[1::2])))
+    r = (s1 + s2) % 10
+    if r == 0:
+        return '0'
+    else:
+        return str(10 - r)
+
+
+def check_lt(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 2)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = s % 11
+    if r == 10:
+        weights = (3, 4, 5, 6, 7, 8, 9, 1, 2, 3, 4)
+        s = sum(w * int(c) for w, c in zip(weights, base))
+        r = (s % 11) % 10
+    return str(r)
+
+
+def check_lv_legal(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (9, 1, 4, 8, 3, 10, 2, 5, 7, 6)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    if base[0] == '9' and s % 11 == 4:
+        s -= 45
+    r = s % 11
+    if r == 4:
+        return '0'
+    elif r > 4:
+        return str(14 - r)
+    else:
+        return str(3 - r)
+
+
+def check_mt(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (3, 4, 6, 7, 8, 9)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    return '%02i' % (37 - s % 37)
+
+
+def check_nl(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (9, 8, 7, 6, 5, 4, 3, 2)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = s % 11
+    if r == 10:
+        return 'f'  # invalid id
+    else:
+        return str(r)
+
+
+def check_pl(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (6, 5, 7, 2, 3, 4, 5, 6, 7)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = s % 11
+    if r == 10:
+        return 'f'  # invalid id
+    else:
+        return str(r)
+
+
+def check_pt(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (9, 8, 7, 6, 5, 4, 3, 2)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = s % 11
+    if r <= 1:
+        return '0'
+    else:
+        return str(11 - r)
+
+
+def check_ro_legal(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (7, 5, 3, 2, 1, 7, 5, 3, 2)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = (10 * s) % 11
+    return str(r % 10)
+
+
+def check_ro_natural(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    y, m, d = int(base[1:3]), int(base[3:5]), int(base[5:7])
+    # first digit indicates century:
+    # 1-2 -> 1900, 3-4 -> 1800, 5-6 -> 2000, 7-9 unspecified
+    c = base[0]
+    if c in ['1', '2']:
+        y += 1900
+    elif c in ['3', '4']:
+        y += 1800
+    else:
+        y += 2000
+    if not is_valid_date(y, m, d):
+        return 'f'  # check failed
+    weights = (2, 7, 9, 1, 4, 6, 3, 5, 8, 2, 7, 9)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = s % 11
+    return str(r % 10)
+
+
+def check_se(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    s1 = sum(chain(*(divmod(2 * int(c), 10) for c in base[::2])))
+    s2 = sum((int(c) for c in base[1::2]))
+    r = (s1 + s2) % 10
+    if r == 0:
+        return '0'
+    else:
+        return str(10 - r)
+
+
+def check_si(base: str, add: Optional[str] = None) -> str:
+    """Check country specific VAT-Id"""
+    weights = (8, 7, 6, 5, 4, 3, 2)
+    s = sum(w * int(c) for w, c in zip(weights, base))
+    r = s % 11
+    if r == 0:
+        return 'f'  # invalid id
+    return str((11 - r) % 10)
+
+
+FORMER_FUNCS = [
+    check_at, check_bg_9d, check_bg_ucn, check_bg_10d, check_cy,
+    check_cz_sp, check_cz_8d, check_dk, check_ee, check_es_prof,
+    check_es_non_prof, check_fi, check_gb, check_gr, check_hu, check_ie_v2,
+    check_ie_v3, check_it, check_lt, check_lv_legal, check_mt, check_nl,
+    check_pl, check_pt, check_ro_legal, check_ro_natural, check_se,
+    check_si,
+]
+
+# Templates for the arguments `base` and `add`; digits are replaced by
+# random digits.
+TEMPLATES = {
+    'check_at': ('1358562', None),
+    'check_bg_9d': ('12345678', None),
+    'check_bg_ucn': ('752316926', None),
+    'check_bg_10d': ('054201103', None),
+    'check_cy': ('12345678', None),
+    'check_cz_sp': ('63333333', None),
+    'check_cz_8d': ('1234567', None),
+    'check_dk': ('13585628', None),
+    'check_ee': ('12345678', None),
+    'check_es_prof': ('A1234567', None),
+    'check_es_non_prof': ('P1234567', None),
+    'check_fi': ('1234567', None),
+    'check_gb': ('434031494', None),
+    'check_gr': ('12345678', None),
+    'check_hu': ('1234567', None),
+    'check_ie_v2': ('3628739', None),
+    'check_ie_v3': ('1234567', 'H'),
+    'check_it': ('0000001021', None),
+    'check_lt': ('12345678901', None),
+    'check_lv_legal': ('4000003521', None),
+    'check_mt': ('123456', None),
+    'check_nl': ('12345678', None),
+    'check_pl': ('123456789', None),
+    'check_pt': ('12345678', None),
+    'check_ro_legal': ('123456789', None),
+    'check_ro_natural': ('190120412345', None),
+    'check_se': ('123456789', None),
+    'check_si': ('1234567', None),
+}
+
+
+def random_args(rnd: Random, name: str,
+                n_args: int) -> List[Tuple[str, Optional[str]]]:
+    """Return `n_args` randomized arguments for check function `name`."""
+    base, add = TEMPLATES[name]
+    return [(''.join(rnd.choice(digits) if c in digits else c
+                     for c in base), add)
+            for _ in range(n_args)]
+
+
+def _run(func: Callable[[str, Optional[str]], str],
+         args_list: List[Tuple[str, Optional[str]]]) -> Callable[[], None]:
+
+    def run() -> None:
+        for base, add in args_list:
+            func(base, add)
+
+    return run
+
+
+def _timed(func: Callable[[], object], repeat: int = 3) -> float:
+    """Return minimal time in seconds needed by `func`."""
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        func()
+        timings.append(default_timer() - start)
+    return min(timings)
+
+
+def main(n_args: int) -> None:
+    """Run the benchmark."""
+    rnd = Random(4711)
+    print(f"{n_args} calls per function, µs/call")
+    print(f"{'function':<20s} {'former':>8s} {'tables':>8s} "
+          f"{'speedup':>8s}")
+    for former in FORMER_FUNCS:
+        name = former.__name__
+        args_list = random_args(rnd, name, n_args)
+        funcs = (former, getattr(euvatid, name))
+        for base, add in args_list[:100]:
+            assert len({func(base, add) for func in funcs}) == 1, \
+                (name, base)
+        elapsed = [_timed(_run(func, args_list)) / n_args * 1e6
+                   for func in funcs]
+        print(f"{name:<20s} {elapsed[0]:8.3f} {elapsed[1]:8.3f} "
+              f"{elapsed[0] / elapsed[1]:7.1f}x")
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Benchmark country specific checks "
+                                        "of VAT ids")
+    parser.add_argument('-n', '--number', type=int, default=20000,
+                        help="number of calls per function (default: 20000)")
+    args = parser.parse_args()
+    main(args.number)
@@ -29,19 +29,17 @@ word, number, letter, symbol, or any combination of those."
 
 
 # standard library imports
+from importlib import import_module
+from typing import List
 
 # local imports
-from .banking import BIC, IBAN
-from .bookland import ISBN, ISMN, ISSN
-from .euvatid import EUVATId
-from .finance import MIC, ISIN
-from .gs1 import GLN, GSIN, GTIN12, GTIN13, GTIN14, SSCC
-from .identifier import Identifier
+from .identifier import Identifier, IdentifierError
 from .version import version as __version__
 
 
 __all__ = [
     'Identifier',
+    'IdentifierError',
     'GLN',
     'GSIN',
     'GTIN12',
@@ -57,3 +55,41 @@ __all__ = [
     'ISIN',
     'EUVATId',
 ]
+
+
+# The modules defining the identifiers load registries (GS1 company
+# prefixes, ISBN ranges, IBAN specs, MICs) when imported. In order to let
+# users pay only for the identifiers they use, these modules are imported
+# on first access to one of their classes.
+_LAZY_ATTRS = {
+    'GLN': 'gs1',
+    'GSIN': 'gs1',
+    'GTIN12': 'gs1',
+    'GTIN13': 'gs1',
+    'GTIN14': 'gs1',
+    'SSCC': 'gs1',
+    'ISBN': 'bookland',
+    'ISMN': 'bookland',
+    'ISSN': 'bookland',
+    'BIC': 'banking',
+    'IBAN': 'banking',
+    'MIC': 'finance',
+    'ISIN': 'finance',
+    'EUVATId': 'euvatid',
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute "
+                             f"'{name}'") from None
+    attr = getattr(import_module(f'.{module_name}', __name__), name)
+    # cache attribute, so that __getattr__ is not called again for it
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -26,7 +26,10 @@ from typing import Tuple
 from iso3166 import countries
 
 # local imports
-from .identifier import Identifier
+from .identifier import (
+    INVALID_FORMAT, INVALID_LENGTH, Identifier, IdentifierError,
+    UNDEFINED_PREFIX, WRONG_CHECK_DIGIT,
+)
 from .ibanregistry import get_iban_spec, IBANSpec
 from .ibanutils import calc_iban_check_digits, split_iban
 
@@ -94,20 +97,23 @@ class BIC(Identifier):
         bic = bic.strip()
         n_chars = len(bic)
         if n_chars not in (8, 11):
-            raise ValueError("BIC must contain 8 or 11 characters.")
-        msg = ''
+            raise IdentifierError(INVALID_LENGTH,
+                                  "BIC must contain 8 or 11 characters.")
+        kind = msg = ''
         try:
             [_ALPHABET.index(char) for char in bic]
         except ValueError:
+            kind = INVALID_FORMAT
             msg = "BIC must only contain letters A-Z or digits."
         country_code = bic[4:6]
         try:
             countries.get(country_code)
         except KeyError:
+            kind = kind or UNDEFINED_PREFIX
             msg = ' '.join((msg,
                             f"Unknown country code: '{country_code}'."))
         if msg:
-            raise ValueError(msg)
+            raise IdentifierError(kind, msg, country_code)
         self._id = bic
 
     def __str__(self) -> str:
@@ -220,28 +226,38 @@ class IBAN(Identifier):
             try:
                 spec = get_iban_spec(country_code)
             except KeyError:
-                raise ValueError(f"Unknown country code: '{country_code}'.")
+                raise IdentifierError(
+                    UNDEFINED_PREFIX,
+                    f"Unknown country code: '{country_code}'.",
+                    country_code)
             if (len(bban) == spec.bban_length and
                     spec.bban_structure.match(bban)):
                 corr_check_digits = calc_iban_check_digits(country_code, bban)
                 if check_digits != corr_check_digits:
-                    raise ValueError(
+                    raise IdentifierError(
+                        WRONG_CHECK_DIGIT,
                         "Wrong check digits: '%s'; should be '%s'."
-                        % (check_digits, corr_check_digits))
+                        % (check_digits, corr_check_digits), country_code)
                 self._id = arg0
             else:
-                raise ValueError('Invalid IBAN format.')
+                raise IdentifierError(INVALID_FORMAT, 'Invalid IBAN format.',
+                                      country_code)
         elif n_args == 3:
             arg0 = args[0]
             if not isinstance(arg0, str):
                 raise TypeError("Country code must be instance of 'str'.")
             if len(arg0) != 2:
-                raise ValueError("Country code must be a 2-character string.")
+                raise IdentifierError(
+                    INVALID_LENGTH,
+                    "Country code must be a 2-character string.")
             country_code = arg0
             try:
                 spec = get_iban_spec(country_code)
             except KeyError:
-                raise ValueError(f"Unknown country code: '{country_code}'.")
+                raise IdentifierError(
+                    UNDEFINED_PREFIX,
+                    f"Unknown country code: '{country_code}'.",
+                    country_code)
             bban_length, bban_structure, bban_split_pos = \
                 spec.bban_length, spec.bban_structure, spec.bban_split_pos
             arg1 = args[1]
@@ -249,14 +265,17 @@ class IBAN(Identifier):
                 if len(arg1) == bban_split_pos:
                     bank_identifier = arg1
                 else:
-                    raise ValueError("Bank identifier, if given as a string, "
-                                     f"must contain {bban_split_pos} chars.")
+                    raise IdentifierError(
+                        INVALID_LENGTH,
+                        "Bank identifier, if given as a string, must "
+                        f"contain {bban_split_pos} chars.", country_code)
             elif isinstance(arg1, int):
                 bank_identifier = f"{arg1:0{bban_split_pos}d}"
                 if len(bank_identifier) != bban_split_pos:
-                    raise ValueError("Bank identifier, if given as an int, "
-                                     "must not have more than "
-                                     f"{bban_split_pos} digits.")
+                    raise IdentifierError(
+                        INVALID_LENGTH,
+                        "Bank identifier, if given as an int, must not have "
+                        f"more than {bban_split_pos} digits.", country_code)
             else:
                 raise TypeError("Bank identifier must be instance of "
                                 "'str' or 'int'.")
@@ -266,15 +285,19 @@ class IBAN(Identifier):
                 if len(arg2) == account_number_length:
                     bank_account_number = arg2
                 else:
-                    raise ValueError("Bank account number, if given as a "
-                                     "string, must contain "
-                                     f"{account_number_length} chars.")
+                    raise IdentifierError(
+                        INVALID_LENGTH,
+                        "Bank account number, if given as a string, must "
+                        f"contain {account_number_length} chars.",
+                        country_code)
             elif isinstance(arg2, int):
                 bank_account_number = f"{arg2:0{account_number_length}d}"
                 if len(bank_account_number) != account_number_length:
-                    raise ValueError("Bank account number, if given as an "
-                                     "int, must not have more than "
-                                     f"{bban_split_pos} digits.")
+                    raise IdentifierError(
+                        INVALID_LENGTH,
+                        "Bank account number, if given as an int, must not "
+                        f"have more than {bban_split_pos} digits.",
+                        country_code)
             else:
                 raise TypeError("Bank account number must be instance of "
                                 "'str' or 'int'.")
@@ -284,7 +307,8 @@ class IBAN(Identifier):
                 self._id = ''.join((country_code, check_digits,
                                     bank_identifier, bank_account_number))
             else:
-                raise ValueError('Invalid IBAN format.')
+                raise IdentifierError(INVALID_FORMAT, 'Invalid IBAN format.',
+                                      country_code)
         else:
             raise TypeError('Invalid number of arguments.')
 
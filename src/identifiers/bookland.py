@@ -19,13 +19,17 @@ r"""International standard identifiers for books, book-like publications,
 periodicals and notated music
 """
 
+from operator import getitem
 import re
-from typing import Optional, Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
-from .identifier import Identifier
+from .identifier import (
+    EXCLUDED_PREFIX, INVALID_FORMAT, INVALID_LENGTH, INVALID_TYPE,
+    Identifier, IdentifierError, UNDEFINED_PREFIX, WRONG_CHECK_DIGIT,
+)
 from .gs1 import GTIN13
-from .isbnutils import lookup_isbn_prefix
-from .ismnutils import lookup_ismn_prefix
+from .isbnutils import find_isbn_prefix, lookup_isbn_prefix
+from .ismnutils import find_ismn_prefix, lookup_ismn_prefix
 
 
 _pattern_1 = re.compile(r'^(\d+)-(\d+)-(\d+)-(\d+)(?:-(\d))?$')
@@ -35,20 +39,118 @@ _pattern_2 = re.compile(r'^(\d+) (\d+) (\d+) (\d+)(?: (\d))?$')
 class _BooklandGTIN(GTIN13):
     """Base class for the "bookland" GTINs."""
 
+    # _registrant_idx (like _ref_idx) is None for instances created by
+    # `from_trusted` until it is computed on first use
     __slots__ = '_registrant_idx'
 
+    @classmethod
+    def from_trusted(cls, raw_id: str) -> "_BooklandGTIN":
+        """Create an instance of `cls` from `raw_id` without validating
+        it (see :meth:`Identifier.from_trusted`)."""
+        obj = cls.__new__(cls)
+        obj._id = raw_id
+        obj._registrant_idx = obj._ref_idx = None
+        return obj
+
+    def _get_ref_idx(self) -> int:
+        """Return index of the publication, computing it if needed."""
+        ref_idx = self._ref_idx
+        if ref_idx is None:
+            reg_idx, ref_idx = self.__class__.lookup_prefix(self._id)
+            self._registrant_idx, self._ref_idx = reg_idx, ref_idx
+        return ref_idx
+
+    def _get_registrant_idx(self) -> int:
+        """Return index of the registrant, computing it if needed."""
+        if self._registrant_idx is None:
+            self._get_ref_idx()
+        return self._registrant_idx
+
+    def _raise_invalid(self, reason: str, digits: str, idx: int) -> None:
+        """Raise IdentifierError for `digits` invalid because of `reason`,
+        with `idx` as returned by `_parse`."""
+        if reason in (UNDEFINED_PREFIX, EXCLUDED_PREFIX):
+            # the detailed message depends on the matching rule, which is
+            # not part of the result of `_parse`, so it is looked up only
+            # when the message is rendered
+            lookup_prefix = self.__class__.lookup_prefix
+
+            def msg() -> str:
+                try:
+                    lookup_prefix(digits)
+                except IdentifierError as exc:
+                    return str(exc)
+                return "Undefined prefix."
+
+            raise IdentifierError(reason, msg)
+        super(_BooklandGTIN, self)._raise_invalid(reason, digits, idx)
+
     @property
     def registration_group(self) -> str:
         """Return the Registration Group of the identifier."""
-        return self._id[3:self._registrant_idx]
+        return self._id[3:self._get_registrant_idx()]
 
     @property
     def registrant(self) -> str:
         """Return the Registrant of the identifier."""
-        return self._id[self._registrant_idx:self._ref_idx]
+        return self._id[self._get_registrant_idx():self._get_ref_idx()]
 
     publication = GTIN13.item_reference
 
+    @classmethod
+    def _parse(cls, digits: str) -> Tuple[Optional[str], str, int, int]:
+        """Check `digits` without raising an exception.
+
+        Returns a tuple of the reason code (None, if `digits` is valid),
+        `digits` completed by the check digit (if omitted), the index of the
+        registrant and the index of the publication.
+        """
+        if not digits.isnumeric():
+            return INVALID_FORMAT, digits, 0, 0
+        res = cls._find_prefix(digits)
+        if res is None:
+            return UNDEFINED_PREFIX, digits, 0, 0
+        reg_idx, ref_idx = res
+        if ref_idx == 0:
+            return EXCLUDED_PREFIX, digits, 0, 0
+        n_digits = len(digits)
+        if n_digits == cls.LENGTH:
+            if cls.calc_check_digit(digits[:-1]) != digits[-1]:
+                return WRONG_CHECK_DIGIT, digits, 0, 0
+        elif n_digits == cls.LENGTH - 1:
+            digits += cls.calc_check_digit(digits)
+        else:
+            return INVALID_LENGTH, digits, 0, 0
+        return None, digits, reg_idx, ref_idx
+
+    @classmethod
+    def _validate(cls, arg: Any) -> Optional[str]:
+        """Return None if `arg` is a valid string representation of an
+        instance of `cls`, otherwise a reason code."""
+        if not isinstance(arg, str):
+            return INVALID_TYPE
+        digits = arg.strip()
+        if digits.isnumeric():
+            return cls._parse(digits)[0]
+        # canonical form given?
+        match = _pattern_1.match(digits) or _pattern_2.match(digits)
+        if not match:
+            return INVALID_FORMAT
+        parts = match.groups()
+        has_check_digit = parts[4] is not None
+        digits = ''.join(parts[:4 + has_check_digit])
+        if len(digits) != cls.LENGTH - 1 + has_check_digit:
+            return INVALID_LENGTH
+        reason, digits, reg_idx, ref_idx = cls._parse(digits)
+        if reason is not None:
+            return reason
+        # the elements must match the ranges given by the prefix
+        if (len(parts[0]) != 3 or
+                len(parts[0]) + len(parts[1]) != reg_idx or
+                reg_idx + len(parts[2]) != ref_idx):
+            return UNDEFINED_PREFIX
+        return None
+
     # noinspection PyMissingConstructor
     def __init__(self, *args) -> None:
         """An instance of {cls} can be created in two ways, by providing a
@@ -113,46 +215,44 @@ class _BooklandGTIN(GTIN13):
                         self.__init__(*parts)
                         return
                 else:
-                    raise ValueError("Argument must only contain digits "
-                                     "or be a string formatted as "
-                                     f"{self.__class__.__name__}.")
-            reg_idx, ref_idx = self.__class__.lookup_prefix(digits)
-            n_digits = len(digits)
-            if n_digits == self.LENGTH:
-                check_digit = self.__class__.calc_check_digit(digits[:-1])
-                if check_digit != digits[-1]:
-                    raise ValueError("Wrong check digit; should be '"
-                                     f"{check_digit}'.")
-            elif n_digits == self.LENGTH - 1:
-                check_digit = self.__class__.calc_check_digit(digits)
-                digits += check_digit
-            else:
-                raise ValueError(f"Argument must have {self.LENGTH}"
-                                 f" or {self.LENGTH - 1} digits.")
+                    raise IdentifierError(
+                        INVALID_FORMAT,
+                        "Argument must only contain digits or be a string "
+                        f"formatted as {self.__class__.__name__}.")
+            reason, digits, reg_idx, ref_idx = \
+                self.__class__._parse(digits)
+            if reason is not None:
+                self._raise_invalid(reason, digits, ref_idx)
         elif 4 <= n_args <= 5:
             digits = ''.join(args)
             if not digits.isnumeric():
-                raise ValueError("Arguments must only contain digits.")
+                raise IdentifierError(INVALID_FORMAT,
+                                      "Arguments must only contain digits.")
             reg_idx, ref_idx = self.__class__.lookup_prefix(digits)
             if len(args[0]) != 3:
-                raise ValueError(f"Undefined GS1 prefix: '{args[0]}'.")
+                raise IdentifierError(UNDEFINED_PREFIX,
+                                      f"Undefined GS1 prefix: '{args[0]}'.")
             if len(''.join(args[:2])) != reg_idx:
-                raise ValueError("Undefined registration group: '" 
-                                 f"{args[1]}'.")
+                raise IdentifierError(UNDEFINED_PREFIX,
+                                      "Undefined registration group: '"
+                                      f"{args[1]}'.")
             if len(''.join(args[:3])) != ref_idx:
-                raise ValueError(f"Undefined registrant: '{args[2]}'.")
+                raise IdentifierError(UNDEFINED_PREFIX,
+                                      f"Undefined registrant: '{args[2]}'.")
             n_digits = len(digits)
             if n_args == 5 and n_digits == self.LENGTH:
                 check_digit = self.__class__.calc_check_digit(digits[:-1])
                 if check_digit != digits[-1]:
-                    raise ValueError("Wrong check digit; should be '"
-                                     f"{check_digit}'.")
+                    raise IdentifierError(WRONG_CHECK_DIGIT,
+                                          "Wrong check digit; should be '"
+                                          f"{check_digit}'.")
             elif n_args == 4 and n_digits == self.LENGTH - 1:
                 check_digit = self.__class__.calc_check_digit(digits)
                 digits += check_digit
             else:
-                raise ValueError(f"{n_args} arguments must contain " 
-                                 f"{self.LENGTH + n_args - 5} digits.")
+                raise IdentifierError(INVALID_LENGTH,
+                                      f"{n_args} arguments must contain "
+                                      f"{self.LENGTH + n_args - 5} digits.")
         else:
             raise TypeError("One, four or five arguments required, "
                             f"{n_args} given.")
@@ -192,6 +292,12 @@ class ISBN(_BooklandGTIN):
         """Check ISBN prefix in `digits`."""
         return lookup_isbn_prefix(digits)
 
+    @staticmethod
+    def _find_prefix(digits: str) -> Optional[Tuple[int, int]]:
+        """Return registrant index and publication index of `digits` or None
+        if `digits` does not contain a defined ISBN prefix."""
+        return find_isbn_prefix(digits)
+
     def __init__(self, *args) -> None:
         super(ISBN, self).__init__(*args)
 
@@ -218,12 +324,24 @@ class ISMN(_BooklandGTIN):
         """Check ISMN prefix in `digits`."""
         return lookup_ismn_prefix(digits)
 
+    @staticmethod
+    def _find_prefix(digits: str) -> Optional[Tuple[int, int]]:
+        """Return registrant index and publication index of `digits` or None
+        if `digits` does not contain the ISMN prefix."""
+        return find_ismn_prefix(digits)
+
     def __init__(self, *args) -> None:
         super(ISMN, self).__init__(*args)
 
     __init__.__doc__ = _BooklandGTIN.__init__.__doc__.format(cls='ISMN')
 
 
+# digit character -> product with the weight of its position, for the 7
+# digits of an ISSN without check digit
+_ISSN_TABLES = tuple({str(d): w * d for d in range(10)}
+                     for w in range(8, 1, -1))
+
+
 class ISSN(Identifier):
     """International Standard Serial Number
 
@@ -235,9 +353,12 @@ class ISSN(Identifier):
     @staticmethod
     def calc_check_digit(digits: str) -> str:
         """Calculate ISSN check digit from `digits`."""
-        checksum = sum((weight * int(digit)
-                        for weight, digit
-                        in zip(range(len(digits) + 1, 1, -1), digits)))
+        if len(digits) == 7 and digits.isascii() and digits.isdigit():
+            checksum = sum(map(getitem, _ISSN_TABLES, digits))
+        else:
+            checksum = sum((weight * int(digit)
+                            for weight, digit
+                            in zip(range(len(digits) + 1, 1, -1), digits)))
         rem = -checksum % 11
         return str(rem) if rem != 10 else 'X'
 
@@ -286,12 +407,14 @@ class ISSN(Identifier):
                     self._id = digits
                     return
                 else:
-                    raise ValueError("Wrong check digit; should be '" 
-                                     f"{check_digit}'.")
-        raise ValueError("Argument must be a string with 8 digits, "
-                         "with 7 digits or with 7 digits followed "
-                         "by an 'X', optionally separated by a blank "
-                         "or a hyphen after the fourth digit.")
+                    raise IdentifierError(WRONG_CHECK_DIGIT,
+                                          "Wrong check digit; should be '"
+                                          f"{check_digit}'.")
+        raise IdentifierError(INVALID_FORMAT,
+                              "Argument must be a string with 8 digits, "
+                              "with 7 digits or with 7 digits followed "
+                              "by an 'X', optionally separated by a blank "
+                              "or a hyphen after the fourth digit.")
 
     def as_gtin(self, addon = None) -> "ISSN13":
         """Return GTIN13 created from `self` + `addon`."""
@@ -318,12 +441,32 @@ class ISSN13(GTIN13):
 
     __slots__ = ()
 
+    _UNDEFINED_PREFIX_MSG = "ISSN prefix must be '977'."
+
     @staticmethod
     def lookup_prefix(digits: str) -> int:
         """Check for ISSN prefix in `digits`."""
         if digits.startswith('977'):
             return 3
-        raise ValueError("ISSN prefix must be '977'.")
+        raise IdentifierError(UNDEFINED_PREFIX, ISSN13._UNDEFINED_PREFIX_MSG)
+
+    @staticmethod
+    def _find_prefix(digits: str) -> Optional[Tuple[str, int]]:
+        """Return ISSN prefix and its length or None if `digits` does not
+        start with the ISSN prefix."""
+        if digits.startswith('977'):
+            return '977', 3
+        return None
+
+    @classmethod
+    def _validate(cls, arg: Any) -> Optional[str]:
+        """Return None if `arg` is a valid string representation of an
+        instance of `cls`, otherwise a reason code."""
+        reason = super(ISSN13, cls)._validate(arg)
+        if reason is not None and ISSN._validate(arg) is None:
+            # `arg` is a valid ISSN
+            return None
+        return reason
 
     def __init__(self, serial_number: Union[ISSN, str],
                  addon: Optional[str] = None) -> None:
@@ -332,8 +475,9 @@ class ISSN13(GTIN13):
                 digits = '977' + serial_number.raw_number + '00'
             elif isinstance(addon, str):
                 if len(addon) != 2 or not addon.isnumeric():
-                    raise ValueError("'addon', if given, must be a string "
-                                     "containing 2 digits.")
+                    raise IdentifierError(INVALID_FORMAT,
+                                          "'addon', if given, must be a "
+                                          "string containing 2 digits.")
                 digits = '977' + serial_number.raw_number + addon
             else:
                 raise TypeError("'addon' must be an instance of 'str'.")
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        dateutils
+# Purpose:     Utility functions for validating dates embedded in identifiers
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Utility functions for validating dates embedded in identifiers"""
+
+
+# standard library imports
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from time import time
+from typing import Tuple
+
+# third-party imports
+
+# local imports
+
+
+# Range of years covered by the calendar table; it includes all years
+# which can be encoded in the identifiers (1800 - 2099).
+MIN_YEAR = 1800
+MAX_YEAR = 2099
+
+# Number of days per month, indexed by (year - MIN_YEAR) * 12 + month - 1.
+_DAYS_IN_MONTH = bytes(monthrange(year, month)[1]
+                       for year in range(MIN_YEAR, MAX_YEAR + 1)
+                       for month in range(1, 13))
+
+
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    """Return True if `year`, `month` and `day` denote a valid date."""
+    if MIN_YEAR <= year <= MAX_YEAR and 0 < month < 13:
+        return 0 < day <= _DAYS_IN_MONTH[(year - MIN_YEAR) * 12 + month - 1]
+    try:
+        date(year, month, day)
+    except ValueError:
+        return False
+    return True
+
+
+# The current date is cached and refreshed at the first call after local
+# midnight.
+_today: Tuple[int, int, int] = (0, 0, 0)
+_refresh_at: float = 0.0
+
+
+def today() -> Tuple[int, int, int]:
+    """Return the current local date as tuple (year, month, day)."""
+    global _today, _refresh_at
+    if time() >= _refresh_at:
+        current = date.today()
+        _today = current.year, current.month, current.day
+        _refresh_at = datetime.combine(current + timedelta(days=1),
+                                       datetime.min.time()).timestamp()
+    return _today
+
+
+def is_past_date(year: int, month: int, day: int) -> bool:
+    """Return True if `year`, `month` and `day` denote a valid date before
+    today."""
+    return is_valid_date(year, month, day) and (year, month, day) < today()
@@ -17,31 +17,56 @@
 """European Union VAT Registration Numbers"""
 
 # standard library imports
-from datetime import date
-from itertools import chain
+from operator import getitem
 import re
 from string import ascii_uppercase
-from typing import Callable, Dict, Match, Optional, Pattern, Tuple
+from typing import (
+    Any, Callable, Dict, Iterable, List, Match, Optional, Pattern, Tuple,
+)
 
 # third-party imports
 
 # local imports
-from .identifier import Identifier
+from .dateutils import is_past_date, is_valid_date
+from .identifier import (
+    INVALID_FORMAT, INVALID_TYPE, Identifier, IdentifierError,
+    UNDEFINED_PREFIX, WRONG_CHECK_DIGIT,
+)
 
 
 CheckFuncType = Callable[[str, Optional[str]], str]
 RulesDictType = Dict[str, Tuple[Pattern, CheckFuncType]]
 _VAT_ID_RULES: RulesDictType = {}
+TablesType = Tuple[Dict[str, int], ...]
+
+
+# Checksums are calculated by table lookup: for each position in the base a
+# table maps the digit characters to the value contributed to the checksum
+# (the product of digit and weight or the digit sum of the doubled digit),
+# so that the checksum is sum(map(getitem, tables, base)).
+
+def _product_tables(weights: Iterable[int]) -> TablesType:
+    """Return tables mapping digit characters to their product with
+    `weights`."""
+    return tuple({str(d): w * d for d in range(10)} for w in weights)
+
+
+# digit character -> value
+_DIGIT = {str(d): d for d in range(10)}
+# digit character -> sum of the digits of the doubled value
+_DOUBLE_DIGIT_SUM = {str(d): sum(divmod(2 * d, 10)) for d in range(10)}
 
 
 # - AT - Austria -
 
+_AT_TABLES = (_DIGIT, _DOUBLE_DIGIT_SUM) * 3 + (_DIGIT,)
+
+
 # noinspection PyUnusedLocal
 def check_at(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s1 = sum((int(c) for c in base[::2]))
-    s2 = sum(chain(*(divmod(2 * int(c), 10) for c in base[1::2])))
-    return str((96 - s1 - s2) % 10)
+    s = sum(map(getitem, _AT_TABLES, base))
+    return str((96 - s) % 10)
 
 
 _VAT_ID_RULES['AT'] = (
@@ -64,20 +89,25 @@ _VAT_ID_RULES['BE'] = (
 
 # - BG - Bulgaria -
 
+_BG_9D_TABLES_1 = _product_tables((1, 2, 3, 4, 5, 6, 7, 8))
+_BG_9D_TABLES_2 = _product_tables((3, 4, 5, 6, 7, 8, 9, 10))
+
+
 # noinspection PyUnusedLocal
 def check_bg_9d(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (1, 2, 3, 4, 5, 6, 7, 8)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _BG_9D_TABLES_1, base))
     r = s % 11
     if r < 10:
         return str(r)
-    weights = (3, 4, 5, 6, 7, 8, 9, 10)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _BG_9D_TABLES_2, base))
     r = s % 11
     return str(r % 10)
 
 
+_BG_UCN_TABLES = _product_tables((2, 4, 8, 5, 10, 9, 7, 3, 6))
+
+
 # noinspection PyUnusedLocal
 def check_bg_ucn(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
@@ -90,24 +120,20 @@ def check_bg_ucn(base: str, add: Optional[str] = None) -> str:
     else:
         month -= 40
         century = 2000
-    try:
-        birthdate = date(century + year, month, day)
-    except ValueError:
+    if not is_past_date(century + year, month, day):
         return 'f'  # invalid ucn
-    else:
-        if birthdate >= date.today():
-            return 'f'  # invalid ucn
-    weights = (2, 4, 8, 5, 10, 9, 7, 3, 6)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _BG_UCN_TABLES, base))
     r = s % 11
     return str(r % 10)
 
 
+_BG_10D_TABLES = _product_tables((21, 19, 17, 13, 11, 9, 7, 3, 1))
+
+
 # noinspection PyUnusedLocal
 def check_bg_10d(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (21, 19, 17, 13, 11, 9, 7, 3, 1)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _BG_10D_TABLES, base))
     return str(s % 10)
 
 
@@ -126,13 +152,14 @@ _VAT_ID_RULES['BG'] = (
 
 # - CY - Cyprus -
 
+_CY_MAP = dict(zip('0123456789', (1, 0, 5, 7, 9, 13, 15, 17, 19, 21)))
+_CY_TABLES = (_CY_MAP, _DIGIT) * 4
+
+
 # noinspection PyUnusedLocal
 def check_cy(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    ch_map = [1, 0, 5, 7, 9, 13, 15, 17, 19, 21]
-    s1 = sum((int(c) for c in base[1::2]))
-    s2 = sum((ch_map[int(c)] for c in base[::2]))
-    r = (s1 + s2) % 26
+    r = sum(map(getitem, _CY_TABLES, base)) % 26
     return chr(ord('A') + r)
 
 
@@ -151,12 +178,7 @@ def _check_cz_date(s: str, variant: Optional[str] = 'new') -> bool:
         y += 2000
     else:
         y += 1900
-    try:
-        date(y, m, d)
-    except ValueError:
-        return False
-    else:
-        return True
+    return is_valid_date(y, m, d)
 
 
 # noinspection PyUnusedLocal
@@ -181,17 +203,20 @@ def check_cz_9d(base: str, add: Optional[str] = None) -> str:
         return 'f'  # check failed
 
 
+_CZ_TABLES = _product_tables(range(8, 1, -1))
+
+
 # noinspection PyUnusedLocal
 def check_cz_sp(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s = sum((8 - i) * int(c) for i, c in enumerate(base[1:]))
+    s = sum(map(getitem, _CZ_TABLES, base[1:]))
     return str(9 - (11 - s % 11) % 10)
 
 
 # noinspection PyUnusedLocal
 def check_cz_8d(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s = sum((8 - i) * int(c) for i, c in enumerate(base))
+    s = sum(map(getitem, _CZ_TABLES, base))
     return str((11 - s % 11) % 10)
 
 
@@ -232,11 +257,13 @@ _VAT_ID_RULES['DE'] = (
 
 # - DK - Denmark -
 
+_DK_TABLES = _product_tables((2, 7, 6, 5, 4, 3, 2, 1))
+
+
 # noinspection PyUnusedLocal
 def check_dk(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (2, 7, 6, 5, 4, 3, 2, 1)
-    s = sum(int(c) * w for (c, w) in zip(base, weights))
+    s = sum(map(getitem, _DK_TABLES, base))
     r = s % 11
     if r == 0:
         return ''  # check ok
@@ -251,11 +278,13 @@ _VAT_ID_RULES['DK'] = (
 
 # - EE - Estonia -
 
+_EE_TABLES = _product_tables((3, 7, 1, 3, 7, 1, 3, 7))
+
+
 # noinspection PyUnusedLocal
 def check_ee(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (3, 7, 1, 3, 7, 1, 3, 7)
-    s = sum(int(c) * w for (c, w) in zip(base, weights))
+    s = sum(map(getitem, _EE_TABLES, base))
     r = s % 10
     if r == 0:
         return '0'
@@ -272,12 +301,14 @@ _VAT_ID_RULES['EE'] = (
 _ES_CC_MAP = 'TRWAGMYFPDXBNJZSQVHLCKE'
 
 
+# tables for the digits following the leading letter
+_ES_TABLES = (_DOUBLE_DIGIT_SUM, _DIGIT) * 3 + (_DOUBLE_DIGIT_SUM,)
+
+
 # noinspection PyUnusedLocal
 def check_es_prof(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s1 = sum(chain(*(divmod(2 * int(c), 10) for c in base[1::2])))
-    s2 = sum((int(c) for c in base[2::2]))
-    r = (s1 + s2) % 10
+    r = sum(map(getitem, _ES_TABLES, base[1:])) % 10
     if r == 0:
         return '0'
     else:
@@ -287,9 +318,7 @@ def check_es_prof(base: str, add: Optional[str] = None) -> str:
 # noinspection PyUnusedLocal
 def check_es_non_prof(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s1 = sum(chain(*(divmod(2 * int(c), 10) for c in base[1::2])))
-    s2 = sum((int(c) for c in base[2::2]))
-    i = 9 - (s1 + s2) % 10
+    i = 9 - sum(map(getitem, _ES_TABLES, base[1:])) % 10
     return ascii_uppercase[i]
 
 
@@ -322,11 +351,13 @@ _VAT_ID_RULES['ES'] = (
 
 # - FI - Finland -
 
+_FI_TABLES = _product_tables((7, 9, 10, 5, 8, 4, 2))
+
+
 # noinspection PyUnusedLocal
 def check_fi(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (7, 9, 10, 5, 8, 4, 2)
-    s = sum(int(c) * w for (c, w) in zip(base, weights))
+    s = sum(map(getitem, _FI_TABLES, base))
     r = s % 11
     if r == 0:
         return '0'
@@ -381,10 +412,13 @@ _VAT_ID_RULES['FR'] = (
 
 # - GB - United Kingdom -
 
+_GB_TABLES = _product_tables(range(8, 1, -1))
+
+
 # noinspection PyUnusedLocal
 def check_gb(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s = sum(int(c) * w for c, w in zip(base[:-2], range(8, 1, -1)))
+    s = sum(map(getitem, _GB_TABLES, base[:-2]))
     cc = int(base[-2:])
     r1 = 97 - s % 97
     if r1 == cc:
@@ -409,10 +443,14 @@ _VAT_ID_RULES['GB'] = (
 
 # - GR - Greece -
 
+# weights 2 ** n, ..., 2 ** 1 for a base of n digits (n <= 8)
+_GR_TABLES = _product_tables(2 ** i for i in range(8, 0, -1))
+
+
 # noinspection PyUnusedLocal
 def check_gr(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s = sum(int(c) * 2 ** i for c, i in zip(base, range(len(base), 0, -1)))
+    s = sum(map(getitem, _GR_TABLES[-len(base):], base))
     return str((s % 11) % 10)
 
 
@@ -446,11 +484,13 @@ _VAT_ID_RULES['HR'] = (
 
 # - HU - Hungary -
 
+_HU_TABLES = _product_tables((9, 7, 3, 1, 9, 7, 3))
+
+
 # noinspection PyUnusedLocal
 def check_hu(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (9, 7, 3, 1, 9, 7, 3)
-    s = sum(int(c) * w for (c, w) in zip(base, weights))
+    s = sum(map(getitem, _HU_TABLES, base))
     r = s % 10
     if r == 0:
         return '0'
@@ -465,6 +505,7 @@ _VAT_ID_RULES['HU'] = (
 # - IE - Ireland -
 
 _IE_CC_MAP = 'WABCDEFGHIJKLMNOPQRSTUV'
+_IE_TABLES = _product_tables(range(8, 1, -1))
 
 
 def check_ie_v1(base, add: Optional[str] = None) -> str:
@@ -476,14 +517,14 @@ def check_ie_v1(base, add: Optional[str] = None) -> str:
 # noinspection PyUnusedLocal
 def check_ie_v2(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s = sum(w * int(c) for w, c in zip(range(8, 1, -1), base))
+    s = sum(map(getitem, _IE_TABLES, base))
     i = s % 23
     return _IE_CC_MAP[i]
 
 
 def check_ie_v3(base, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s = sum((w * int(c) for w, c in zip(range(8, 1, -1), base)),
+    s = sum(map(getitem, _IE_TABLES, base),
             9 * (ord(add) - ord('@')))  # 'A' - 'I' -> 1 - 9
     i = s % 23
     return _IE_CC_MAP[i]
@@ -503,12 +544,13 @@ _VAT_ID_RULES['IE'] = (
 
 # - IT - Italy -
 
+_IT_TABLES = (_DIGIT, _DOUBLE_DIGIT_SUM) * 5
+
+
 # noinspection PyUnusedLocal
 def check_it(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s1 = sum((int(c) for c in base[::2]))
-    s2 = sum(chain(*(divmod(2 * int(c), 10) for c in base[1::2])))
-    r = (s1 + s2) % 10
+    r = sum(map(getitem, _IT_TABLES, base)) % 10
     if r == 0:
         return '0'
     else:
@@ -523,15 +565,17 @@ _VAT_ID_RULES['IT'] = (
 
 # - LT - Lithuania -
 
+_LT_TABLES_1 = _product_tables((1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 2))
+_LT_TABLES_2 = _product_tables((3, 4, 5, 6, 7, 8, 9, 1, 2, 3, 4))
+
+
 # noinspection PyUnusedLocal
 def check_lt(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 2)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _LT_TABLES_1, base))
     r = s % 11
     if r == 10:
-        weights = (3, 4, 5, 6, 7, 8, 9, 1, 2, 3, 4)
-        s = sum(w * int(c) for w, c in zip(weights, base))
+        s = sum(map(getitem, _LT_TABLES_2, base))
         r = (s % 11) % 10
     return str(r)
 
@@ -557,11 +601,13 @@ _VAT_ID_RULES['LU'] = (
 
 # - LV - Latvia -
 
+_LV_TABLES = _product_tables((9, 1, 4, 8, 3, 10, 2, 5, 7, 6))
+
+
 # noinspection PyUnusedLocal
 def check_lv_legal(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (9, 1, 4, 8, 3, 10, 2, 5, 7, 6)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _LV_TABLES, base))
     if base[0] == '9' and s % 11 == 4:
         s -= 45
     r = s % 11
@@ -579,12 +625,10 @@ def check_lv_natural(base: str, add: Optional[str] = None) -> str:
     d, m, y = int(base[:2]), int(base[2:4]), int(base[4:6])
     # 7th digit indicates century
     y += 1800 + int(base[6]) * 100
-    try:
-        date(y, m, d)
-    except ValueError:
-        return 'f'  # check failed
-    else:
+    if is_valid_date(y, m, d):
         return ''  # check ok
+    else:
+        return 'f'  # check failed
 
 
 _VAT_ID_RULES['LV'] = (
@@ -598,11 +642,13 @@ _VAT_ID_RULES['LV'] = (
 
 # - MT - Malta -
 
+_MT_TABLES = _product_tables((3, 4, 6, 7, 8, 9))
+
+
 # noinspection PyUnusedLocal
 def check_mt(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (3, 4, 6, 7, 8, 9)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _MT_TABLES, base))
     return '%02i' % (37 - s % 37)
 
 
@@ -613,11 +659,13 @@ _VAT_ID_RULES['MT'] = (
 
 # - NL - Netherlands -
 
+_NL_TABLES = _product_tables((9, 8, 7, 6, 5, 4, 3, 2))
+
+
 # noinspection PyUnusedLocal
 def check_nl(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (9, 8, 7, 6, 5, 4, 3, 2)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _NL_TABLES, base))
     r = s % 11
     if r == 10:
         return 'f'  # invalid id
@@ -633,11 +681,13 @@ _VAT_ID_RULES['NL'] = (
 
 # - PL - Poland -
 
+_PL_TABLES = _product_tables((6, 5, 7, 2, 3, 4, 5, 6, 7))
+
+
 # noinspection PyUnusedLocal
 def check_pl(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (6, 5, 7, 2, 3, 4, 5, 6, 7)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _PL_TABLES, base))
     r = s % 11
     if r == 10:
         return 'f'  # invalid id
@@ -652,11 +702,13 @@ _VAT_ID_RULES['PL'] = (
 
 # - PT - Portugal -
 
+_PT_TABLES = _product_tables((9, 8, 7, 6, 5, 4, 3, 2))
+
+
 # noinspection PyUnusedLocal
 def check_pt(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (9, 8, 7, 6, 5, 4, 3, 2)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _PT_TABLES, base))
     r = s % 11
     if r <= 1:
         return '0'
@@ -671,15 +723,20 @@ _VAT_ID_RULES['PT'] = (
 
 # - RO - Romania -
 
+_RO_LEGAL_TABLES = _product_tables((7, 5, 3, 2, 1, 7, 5, 3, 2))
+
+
 # noinspection PyUnusedLocal
 def check_ro_legal(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (7, 5, 3, 2, 1, 7, 5, 3, 2)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _RO_LEGAL_TABLES, base))
     r = (10 * s) % 11
     return str(r % 10)
 
 
+_RO_NATURAL_TABLES = _product_tables((2, 7, 9, 1, 4, 6, 3, 5, 8, 2, 7, 9))
+
+
 # noinspection PyUnusedLocal
 def check_ro_natural(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
@@ -693,12 +750,9 @@ def check_ro_natural(base: str, add: Optional[str] = None) -> str:
         y += 1800
     else:
         y += 2000
-    try:
-        date(y, m, d)
-    except ValueError:
+    if not is_valid_date(y, m, d):
         return 'f'  # check failed
-    weights = (2, 7, 9, 1, 4, 6, 3, 5, 8, 2, 7, 9)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _RO_NATURAL_TABLES, base))
     r = s % 11
     return str(r % 10)
 
@@ -715,12 +769,13 @@ _VAT_ID_RULES['RO'] = (
 
 # - SE - Sweden -
 
+_SE_TABLES = (_DOUBLE_DIGIT_SUM, _DIGIT) * 5
+
+
 # noinspection PyUnusedLocal
 def check_se(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    s1 = sum(chain(*(divmod(2 * int(c), 10) for c in base[::2])))
-    s2 = sum((int(c) for c in base[1::2]))
-    r = (s1 + s2) % 10
+    r = sum(map(getitem, _SE_TABLES, base)) % 10
     if r == 0:
         return '0'
     else:
@@ -735,11 +790,13 @@ _VAT_ID_RULES['SE'] = (
 
 # - SI - Slovenia -
 
+_SI_TABLES = _product_tables((8, 7, 6, 5, 4, 3, 2))
+
+
 # noinspection PyUnusedLocal
 def check_si(base: str, add: Optional[str] = None) -> str:
     """Check country specific VAT-Id"""
-    weights = (8, 7, 6, 5, 4, 3, 2)
-    s = sum(w * int(c) for w, c in zip(weights, base))
+    s = sum(map(getitem, _SI_TABLES, base))
     r = s % 11
     if r == 0:
         return 'f'  # invalid id
@@ -778,6 +835,65 @@ def get_first_match(rules: RulesDictType, candidate: str) \
     return None, None
 
 
+# The rules of a country are compiled into a single pattern, with one named
+# branch per rule, so that a registration code is classified by a single
+# match. The branches are tried in the order of the rules, as done by
+# `get_first_match`. Because group names must be unique, the groups of the
+# branch for rule i are renamed to 'r<i>_<name>'. For each branch, the check
+# function, the indices of its groups 'base', 'check' and 'add' and the index
+# of the rule are mapped to the index of the branch group, which is the
+# match's `lastindex`.
+BranchInfoType = Tuple[Optional[CheckFuncType], Optional[int], Optional[int],
+                       Optional[int], int]
+_GROUP_NAME = re.compile(r'\(\?P<(\w+)>')
+_VAT_ID_DISPATCH: Dict[str, Tuple[Pattern, Dict[int, BranchInfoType]]] = {}
+
+
+def _compile_dispatch(rules: RulesDictType) \
+        -> Tuple[Pattern, Dict[int, BranchInfoType]]:
+    """Compile `rules` into a single pattern."""
+    branches = []
+    for idx, (pattern, _) in enumerate(rules):
+        branch = _GROUP_NAME.sub(rf'(?P<r{idx}_\1>', pattern.pattern)
+        branches.append(f'(?P<r{idx}>{branch})')
+    # only ascii digits are accepted, as expected by the check functions
+    combined = re.compile('|'.join(branches), re.ASCII)
+    group_idx = combined.groupindex
+    branch_info = {group_idx[f'r{idx}']: (check,
+                                          group_idx.get(f'r{idx}_base'),
+                                          group_idx.get(f'r{idx}_check'),
+                                          group_idx.get(f'r{idx}_add'),
+                                          idx)
+                   for idx, (_, check) in enumerate(rules)}
+    return combined, branch_info
+
+
+def _get_dispatch(country_code: str) \
+        -> Tuple[Pattern, Dict[int, BranchInfoType]]:
+    """Return the combined pattern for `country_code` and the info about its
+    branches.
+
+    Raises KeyError if `country_code` is unknown."""
+    try:
+        return _VAT_ID_DISPATCH[country_code]
+    except KeyError:
+        # compiled on first use, so that importing the module does not have
+        # to pay for compiling the patterns of all countries
+        dispatch = _compile_dispatch(_VAT_ID_RULES[country_code])
+        _VAT_ID_DISPATCH[country_code] = dispatch
+        return dispatch
+
+
+def _mismatch_msg(country_code: str, reg_code: str) -> str:
+    """Return message for `reg_code` not matching the patterns of
+    `country_code`."""
+    rules = _VAT_ID_RULES[country_code]
+    return f"'{reg_code}' does not match the " \
+           f"pattern{'' if len(rules) == 1 else 's'} " \
+           f"for '{country_code}': " \
+           f"'{' | '.join((p.pattern for p, _ in rules))}'."
+
+
 class EUVATId(Identifier):
     """European Union VAT Registration Number
 
@@ -809,6 +925,67 @@ class EUVATId(Identifier):
         tuple."""
         return self.country_code, self.registration_code
 
+    @classmethod
+    def _validate(cls, arg: Any) -> Optional[str]:
+        """Return None if `arg` is a valid string representation of an
+        instance of `cls`, otherwise a reason code."""
+        return cls.validate_many((arg,))[0]
+
+    @classmethod
+    def validate_many(cls, args: Iterable[Any]) -> List[Optional[str]]:
+        """Validate string representations of VAT ids.
+
+        Args:
+            args (Iterable): strings to be validated
+
+        Returns:
+            list: one entry per element of `args`, None if the element is
+                valid, otherwise a code giving the reason why it is invalid
+
+        Reason codes:
+
+        - 'type': element is not a string
+        - 'prefix': element contains an unknown country code
+        - 'format': element does not match the format required for its
+          country code
+        - 'check_digit': element does not pass the checks for its country
+          code
+
+        The elements are normalized like in the constructor and grouped by
+        country code, so that each country's rules are applied to all its
+        elements in one go. No exceptions are raised for invalid elements.
+        """
+        results: List[Optional[str]] = []
+        groups: Dict[str, List[Tuple[int, str]]] = {}
+        for idx, arg in enumerate(args):
+            if isinstance(arg, str):
+                vat_id = arg.strip().upper()
+                groups.setdefault(vat_id[:2], []).append((idx, vat_id[2:]))
+                results.append(None)
+            else:
+                results.append(INVALID_TYPE)
+        for country_code, items in groups.items():
+            try:
+                pattern, branches = _get_dispatch(country_code)
+            except KeyError:
+                for idx, _ in items:
+                    results[idx] = UNDEFINED_PREFIX
+                continue
+            match_code = pattern.match
+            for idx, reg_code in items:
+                match = match_code(reg_code)
+                if match is None or match.end() != len(reg_code):
+                    results[idx] = INVALID_FORMAT
+                    continue
+                check, base_idx, check_idx, add_idx, _ = \
+                    branches[match.lastindex]
+                if (check is not None and
+                        check(match.group(base_idx),
+                              match.group(add_idx) if add_idx else None) !=
+                        (match.group(check_idx) if check_idx else '')):
+                    results[idx] = WRONG_CHECK_DIGIT
+        return results
+
     # noinspection PyMissingConstructor
     def __init__(self, vat_id: str) -> None:
         """Instances of EUVATId are created from a string containing the
@@ -836,28 +1013,30 @@ class EUVATId(Identifier):
         vat_id = vat_id.strip().upper()
         country_code = vat_id[:2]
         try:
-            rules = _VAT_ID_RULES[country_code]
+            pattern, branches = _get_dispatch(country_code)
         except KeyError:
-            msg = f"Unknown country code: '{country_code}'"
-        else:
-            reg_code = vat_id[2:]
-            match, check = get_first_match(rules, reg_code)
-            if match and match.end() == len(reg_code):
-                if (check is None or
-                        check(match.group('base'),
-                              match.groupdict().get('add')) ==
-                        match.groupdict().get('check', '')):
-                    self._id = vat_id
-                    return
-                else:
-                    msg = f"'{reg_code}' does not pass the checks for " \
-                          f"'{country_code}'."
-            else:
-                msg = f"'{reg_code}' does not match the " \
-                      f"pattern{'' if len(rules) == 1 else 's'} " \
-                      f"for '{country_code}': " \
-                      f"'{' | '.join((p.pattern for p, _ in rules))}'."
-        raise ValueError(msg)
+            raise IdentifierError(UNDEFINED_PREFIX,
+                                  f"Unknown country code: '{country_code}'",
+                                  country_code) from None
+        reg_code = vat_id[2:]
+        match = pattern.match(reg_code)
+        if match and match.end() == len(reg_code):
+            check, base_idx, check_idx, add_idx, rule_idx = \
+                branches[match.lastindex]
+            if (check is None or
+                    check(match.group(base_idx),
+                          match.group(add_idx) if add_idx else None) ==
+                    (match.group(check_idx) if check_idx else '')):
+                self._id = vat_id
+                return
+            raise IdentifierError(WRONG_CHECK_DIGIT,
+                                  f"'{reg_code}' does not pass the checks "
+                                  f"for '{country_code}'.",
+                                  country_code, rule_idx)
+        # the patterns are only joined if the message is used
+        raise IdentifierError(INVALID_FORMAT,
+                              lambda: _mismatch_msg(country_code, reg_code),
+                              country_code)
 
     def __str__(self) -> str:
         """str(self)"""
@@ -19,14 +19,17 @@
 
 # standard library imports
 from string import ascii_uppercase, digits
-from typing import Tuple
+from typing import Any, Tuple
 
 # third-party imports
-from iso3166 import countries
+from iso3166 import countries, countries_by_alpha2
 
 # local imports
-from .identifier import Identifier
-from .luhn import luhn
+from .identifier import (
+    INVALID, INVALID_FORMAT, INVALID_LENGTH, Identifier, IdentifierError,
+    UNDEFINED_PREFIX, WRONG_CHECK_DIGIT,
+)
+from .luhn import luhn, luhn_array
 from .micutils import get_mic_record
 
 
@@ -64,7 +67,7 @@ class MIC(Identifier):
         try:
             get_mic_record(mic)
         except KeyError:
-            raise ValueError(f"Unknown MIC: '{mic}'.")
+            raise IdentifierError(INVALID, f"Unknown MIC: '{mic}'.")
         self._id = mic
 
     def __str__(self) -> str:
@@ -93,6 +96,56 @@ class ISIN(Identifier):
         """Calculate ISIN check digit."""
         return str(luhn(country_code + nsin))
 
+    @staticmethod
+    def check_digits_array(isins: Any) -> Tuple[Any, Any]:
+        """Check the check digits of all elements of `isins` at once.
+
+        Args:
+            isins: array-like of ISINs (without surrounding whitespace),
+                preferably a numpy array of fixed-width bytes (for example
+                created by `numpy.array(isins, dtype='S12')`) or a
+                2-dimensional numpy array of type uint8 holding the
+                characters of one ISIN per row
+
+        Returns:
+            tuple of two 1-dimensional numpy arrays: a boolean mask telling
+            which elements are valid ISINs (having 12 characters, a known
+            country code and a correct check digit) and the expected check
+            digits (as int8, -1 for elements containing invalid characters)
+
+        Raises:
+            ImportError: numpy is not installed
+            TypeError: `isins` can not be converted to an array of uint8
+        """
+        import numpy as np
+        isins = np.asarray(isins)
+        if isins.dtype.kind == 'U':
+            isins = isins.astype('S')
+        if isins.dtype.kind == 'S' and isins.ndim == 1:
+            isins = np.ascontiguousarray(isins).view(np.uint8) \
+                .reshape(isins.size, isins.dtype.itemsize)
+        if isins.dtype != np.uint8 or isins.ndim != 2:
+            raise TypeError("Argument must be a 2-dimensional array of "
+                            "'uint8' or a 1-dimensional array of 'bytes' or "
+                            "'str'.")
+        n_isins, width = isins.shape
+        if width < 12:
+            chars = np.zeros((n_isins, 12), dtype=np.uint8)
+            chars[:, :width] = isins
+        else:
+            chars = isins
+        is_valid = (chars[:, :12] != 0).all(axis=1)
+        if width > 12:
+            is_valid &= (chars[:, 12:] == 0).all(axis=1)
+        country_codes = np.ascontiguousarray(chars[:, :2]).view('S2')[:, 0]
+        is_valid &= np.isin(country_codes,
+                            np.array(list(countries_by_alpha2), dtype='S2'))
+        check_digits = luhn_array(chars[:, :11])
+        # luhn returns 10 instead of 0, which never matches a digit
+        is_valid &= ((chars[:, 11] - np.uint8(ord('0'))) == check_digits) \
+            & (check_digits < 10)
+        return is_valid, check_digits
+
     @property
     def country_code(self) -> str:
         """Return the ISIN's Country Code."""
@@ -161,30 +214,46 @@ class ISIN(Identifier):
                 raise TypeError("Argument must be instance of 'str'.")
             arg0 = arg0.strip()
             if len(arg0) != 12:
-                raise ValueError('Invalid ISIN format: '
-                                 'given string must be 12 characters long.')
+                raise IdentifierError(
+                    INVALID_LENGTH, 'Invalid ISIN format: given string must '
+                                    'be 12 characters long.')
             country_code = arg0[:2]
             try:
                 countries.get(country_code)
             except KeyError:
-                raise ValueError(f"Unknown country code: '{country_code}'.")
+                raise IdentifierError(
+                    UNDEFINED_PREFIX,
+                    f"Unknown country code: '{country_code}'.",
+                    country_code)
             nsin = arg0[2:-1]
-            check_digit = self.__class__.calc_check_digit(country_code, nsin)
+            try:
+                check_digit = \
+                    self.__class__.calc_check_digit(country_code, nsin)
+            except ValueError:
+                raise IdentifierError(
+                    INVALID_FORMAT, "Given NSIN must only contain digits "
+                                    "and upper case letters.", country_code)
             if check_digit != arg0[-1]:
-                raise ValueError("Wrong check digit; should be "
-                                 f"'{check_digit}'.")
+                raise IdentifierError(WRONG_CHECK_DIGIT,
+                                      "Wrong check digit; should be "
+                                      f"'{check_digit}'.", country_code)
             self._id = arg0
         elif n_args == 2:
             arg0 = args[0]
             if not isinstance(arg0, str):
                 raise TypeError("Country code must be instance of 'str'.")
             if len(arg0) != 2:
-                raise ValueError("Country code must be a 2-character string.")
+                raise IdentifierError(
+                    INVALID_LENGTH,
+                    "Country code must be a 2-character string.")
             country_code = arg0
             try:
                 countries.get(country_code)
             except KeyError:
-                raise ValueError(f"Unknown country code: '{country_code}'.")
+                raise IdentifierError(
+                    UNDEFINED_PREFIX,
+                    f"Unknown country code: '{country_code}'.",
+                    country_code)
             arg1 = args[1]
             if isinstance(arg1, str):
                 len_nsin = len(arg1)
@@ -193,11 +262,18 @@ class ISIN(Identifier):
                 elif 6 <= len_nsin < 9:
                     nsin = arg1.rjust(9, '0')
                 else:
-                    raise ValueError("Given NSIN must contain between 6 and 9"
-                                     " characters.")
+                    raise IdentifierError(
+                        INVALID_LENGTH, "Given NSIN must contain between 6 "
+                                        "and 9 characters.", country_code)
             else:
                 raise TypeError("Given nsin must be instance of 'str'.")
-            check_digit = self.__class__.calc_check_digit(country_code, nsin)
+            try:
+                check_digit = \
+                    self.__class__.calc_check_digit(country_code, nsin)
+            except ValueError:
+                raise IdentifierError(
+                    INVALID_FORMAT, "Given NSIN must only contain digits "
+                                    "and upper case letters.", country_code)
             self._id = ''.join((country_code, nsin, check_digit))
         else:
             raise TypeError('Invalid number of arguments.')
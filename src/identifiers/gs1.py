@@ -18,11 +18,16 @@
 
 
 from abc import abstractmethod
-from typing import Callable, Optional, Tuple
+from typing import Any, Callable, Optional, Tuple
 
 
-from .identifier import Identifier
-from .gs1utils import lookup_company_prefix
+from .identifier import (
+    EXCLUDED_PREFIX, INVALID_FORMAT, INVALID_LENGTH, INVALID_TYPE,
+    Identifier, IdentifierError, UNDEFINED_PREFIX, WRONG_CHECK_DIGIT,
+)
+from .gs1utils import (
+    calc_check_digit, find_company_prefix, lookup_company_prefix,
+)
 
 
 class GS1NumericalIdentifier(Identifier):
@@ -34,22 +39,45 @@ class GS1NumericalIdentifier(Identifier):
           having a fixed length and a check digit at the end.
     """
 
+    # _ref_idx holds the index of the reference part; it is None for
+    # instances created by `from_trusted` until it is computed on first use
     __slots__ = '_ref_idx'
 
+    _UNDEFINED_PREFIX_MSG = "Undefined prefix."
+
+    @classmethod
+    def from_trusted(cls, raw_id: str) -> "GS1NumericalIdentifier":
+        """Create an instance of `cls` from `raw_id` without validating
+        it (see :meth:`Identifier.from_trusted`)."""
+        obj = cls.__new__(cls)
+        obj._id = raw_id
+        obj._ref_idx = None
+        return obj
+
+    def _get_ref_idx(self) -> int:
+        """Return index of the reference part, computing it if needed."""
+        ref_idx = self._ref_idx
+        if ref_idx is None:
+            offset = self.EXTRA_DIGITS
+            self._ref_idx = ref_idx = \
+                self.__class__.lookup_prefix(self._id[offset:]) + offset
+        return ref_idx
+
     @staticmethod
     def lookup_prefix(digits: str) -> int:
         """Validate company prefix of a GS1NumericalIdentifier."""
         return lookup_company_prefix(digits)
 
+    @staticmethod
+    def _find_prefix(digits: str) -> Optional[Tuple[str, int]]:
+        """Return prefix of `digits` and length of company prefix (0 if
+        prefix is excluded) or None if prefix is undefined."""
+        return find_company_prefix(digits)
+
     @staticmethod
     def calc_check_digit(digits: str) -> str:
         """Calculate and return the GS1 check digit."""
-        ints = [int(d) for d in digits]
-        n_digits = len(ints)
-        odds = slice((n_digits - 1) % 2, n_digits, 2)
-        even = slice(n_digits % 2, n_digits, 2)
-        checksum = 3 * sum(ints[odds]) + sum(ints[even])
-        return str(-checksum % 10)
+        return calc_check_digit(digits)
 
     # noinspection PyPep8Naming
     @property
@@ -75,18 +103,74 @@ class GS1NumericalIdentifier(Identifier):
     def company_prefix(self) -> str:
         """Return the identifier's company prefix part."""
         offset = self.EXTRA_DIGITS
-        return self._id[offset:self._ref_idx]
+        return self._id[offset:self._get_ref_idx()]
 
     @property
     def _reference(self) -> str:
         """Return the identifier's reference part."""
-        return self._id[self._ref_idx:-1]
+        return self._id[self._get_ref_idx():-1]
 
     @property
     def check_digit(self) -> str:
         """Return the identifier's check digit."""
         return self._id[-1]
 
+    @classmethod
+    def _parse(cls, digits: str) -> Tuple[Optional[str], str, int]:
+        """Check `digits` without raising an exception.
+
+        Returns a tuple of the reason code (None, if `digits` is valid),
+        `digits` completed by the check digit (if omitted) and the index of
+        the reference part (or, if the prefix is excluded, the index of the
+        end of the prefix).
+        """
+        if not digits.isnumeric():
+            return INVALID_FORMAT, digits, 0
+        offset = cls.EXTRA_DIGITS
+        res = cls._find_prefix(digits[offset:])
+        if res is None:
+            return UNDEFINED_PREFIX, digits, 0
+        prefix, cp_length = res
+        if cp_length == 0:
+            return EXCLUDED_PREFIX, digits, len(prefix) + offset
+        n_digits = len(digits)
+        if n_digits == cls.LENGTH:
+            if cls.calc_check_digit(digits[:-1]) != digits[-1]:
+                return WRONG_CHECK_DIGIT, digits, 0
+        elif n_digits == cls.LENGTH - 1:
+            digits += cls.calc_check_digit(digits)
+        else:
+            return INVALID_LENGTH, digits, 0
+        return None, digits, cp_length + offset
+
+    @classmethod
+    def _validate(cls, arg: Any) -> Optional[str]:
+        """Return None if `arg` is a valid string representation of an
+        instance of `cls`, otherwise a reason code."""
+        if not isinstance(arg, str):
+            return INVALID_TYPE
+        return cls._parse(arg)[0]
+
+    def _raise_invalid(self, reason: str, digits: str, idx: int) -> None:
+        """Raise IdentifierError for `digits` invalid because of `reason`,
+        with `idx` as returned by `_parse`."""
+        if reason == INVALID_FORMAT:
+            raise IdentifierError(reason,
+                                  "Argument must only contain digits.")
+        if reason == UNDEFINED_PREFIX:
+            raise IdentifierError(reason, self._UNDEFINED_PREFIX_MSG)
+        if reason == EXCLUDED_PREFIX:
+            prefix = digits[self.EXTRA_DIGITS:idx]
+            raise IdentifierError(reason, f"Excluded prefix: '{prefix}'.")
+        if reason == WRONG_CHECK_DIGIT:
+            calc_check_digit = self.__class__.calc_check_digit
+            raise IdentifierError(
+                reason, lambda: "Wrong check digit; should be "
+                                f"'{calc_check_digit(digits[:-1])}'.")
+        raise IdentifierError(INVALID_LENGTH,
+                              f"Argument must have {self.LENGTH} or "
+                              f"{self.LENGTH - 1} digits.")
+
     # noinspection PyMissingConstructor
     def __init__(self, *args: str) -> None:
         """An instance of {cls} can be created in two ways, by providing a
@@ -142,22 +226,9 @@ class GS1NumericalIdentifier(Identifier):
         # 1. form: one argument given
         if n_args == 1:
             digits = args[0]
-            if not digits.isnumeric():
-                raise ValueError("Argument must only contain digits.")
-            n_digits = len(digits)
-            offset = self.EXTRA_DIGITS
-            ref_idx = self.__class__.lookup_prefix(digits[offset:]) + offset
-            if n_digits == self.LENGTH:
-                check_digit = self.__class__.calc_check_digit(digits[:-1])
-                if check_digit != digits[-1]:
-                    raise ValueError("Wrong check digit; should be "
-                                     f"'{check_digit}'.")
-            elif n_digits == self.LENGTH - 1:
-                check_digit = self.__class__.calc_check_digit(digits)
-                digits += check_digit
-            else:
-                raise ValueError(f"Argument must have {self.LENGTH} or "
-                                 f"{self.LENGTH - 1} digits.")
+            reason, digits, ref_idx = self.__class__._parse(digits)
+            if reason is not None:
+                self._raise_invalid(reason, digits, ref_idx)
         # 2. form: single elements given
         else:
             error_msg = None
@@ -192,29 +263,35 @@ class GS1NumericalIdentifier(Identifier):
                 raise TypeError(error_msg.format(n_args))
             digits = ''.join(args)
             if not digits.isnumeric():
-                raise ValueError("Arguments must only contain digits.")
+                raise IdentifierError(INVALID_FORMAT,
+                                      "Arguments must only contain digits.")
             offset = self.EXTRA_DIGITS
             if offset and len(extra_digits) != offset:
-                raise ValueError(f"First element must contain {offset}"
-                                 f" digit{'s' * min(offset - 1, 1)}, "
-                                 f"{len(extra_digits)} given.")
+                raise IdentifierError(INVALID_LENGTH,
+                                      f"First element must contain {offset}"
+                                      f" digit{'s' * min(offset - 1, 1)}, "
+                                      f"{len(extra_digits)} given.")
             ref_idx = self.__class__.lookup_prefix(digits[offset:]) + offset
             if len(company_prefix) + offset != ref_idx:
-                raise ValueError("Undefined company prefix: "
-                                 f"'{company_prefix}'.")
+                raise IdentifierError(UNDEFINED_PREFIX,
+                                      "Undefined company prefix: "
+                                      f"'{company_prefix}'.")
             len_ref_elem = self.LENGTH - ref_idx - 1
             if len(ref_elem) != len_ref_elem:
-                raise ValueError(f"{('Second', 'Third')[extra_arg]}"
-                                 " argument must contain "
-                                 f"{len_ref_elem} digits.")
+                raise IdentifierError(INVALID_LENGTH,
+                                      f"{('Second', 'Third')[extra_arg]}"
+                                      " argument must contain "
+                                      f"{len_ref_elem} digits.")
             if check_digit:
                 if len(check_digit) != 1:
-                    raise ValueError("Check digit must only be one digit.")
+                    raise IdentifierError(
+                        INVALID_LENGTH, "Check digit must only be one digit.")
                 valid_check_digit = \
                     self.__class__.calc_check_digit(digits[:-1])
                 if check_digit != valid_check_digit:
-                    raise ValueError("Wrong check digit; should be " 
-                                     f"'{valid_check_digit}'.")
+                    raise IdentifierError(WRONG_CHECK_DIGIT,
+                                          "Wrong check digit; should be "
+                                          f"'{valid_check_digit}'.")
             else:
                 check_digit = self.__class__.calc_check_digit(digits)
                 digits += check_digit
@@ -380,7 +457,7 @@ class GTIN14(GTIN):
             if isinstance(arg, (GTIN13, GTIN12)):
                 pad = self.LENGTH - arg.LENGTH
                 self._id = '0' * pad + arg._id
-                self._ref_idx = arg._ref_idx + pad
+                self._ref_idx = arg._get_ref_idx() + pad
                 return
         super(GTIN14, self).__init__(*args)
 
@@ -17,25 +17,559 @@
 """Utility functions for GS1 identifiers"""
 
 
+from array import array
+from hashlib import sha256
+from mmap import ACCESS_READ, mmap
 import os.path
-from bisect import bisect
+import struct
+import sys
+from threading import Lock
+from typing import Any, Iterator, List, Optional, Tuple, Union
 from xml.etree import ElementTree as ETree
 
+from .identifier import EXCLUDED_PREFIX, IdentifierError, UNDEFINED_PREFIX
+from .prefixcache import PrefixCache
 
-file_name = os.path.join(os.path.dirname(__file__), "GS1_CP_Ranges.xml")
 
-etree = ETree.parse(file_name)
-root = etree.getroot()
-prefix_list = [(elem.get('prefix'), int(elem.get('gcpLength')))
-               for elem in root]
+pkg_dir = os.path.dirname(__file__)
+file_name = os.path.join(pkg_dir, "GS1_CP_Ranges.xml")
+
+# The XML file is the source of truth for the company prefixes. In order to
+# avoid parsing it in every process, it is compiled into a binary file with
+# the following layout:
+#
+# header:   magic bytes, format version, byte order, SHA-256 digest, size and
+#           modification time (ns) of the XML file, number of prefixes and
+#           number of trie nodes
+# keys:     the prefixes in ascending order, each as ascii string, padded with
+#           NUL bytes to KEY_WIDTH bytes
+# lengths:  the length of the company prefix (gcpLength) belonging to each
+#           prefix, one byte each
+# nodes:    digit trie of the prefixes (see below), aligned to 4 bytes
+#
+# Padding with NUL bytes preserves the ordering of the prefixes, so that a
+# binary search can be done directly on the fixed-width keys.
+#
+# Lookups are done via the digit trie, so that finding a prefix takes at
+# most KEY_WIDTH indexing operations. The trie is stored as an array of
+# nodes, each holding 10 signed 32-bit integers in native byte order, one for
+# each digit. A value of 0 means that there is no prefix starting with the
+# digits seen so far, a positive value is the array index of the next node
+# and a negative value marks the end of a prefix, encoding its length and
+# the length of the company prefix as ~(prefix_length << 4 | gcpLength).
+# The binary search on the keys is kept as reference implementation.
+#
+# The binary file is (re-)created on first use, if it does not exist or does
+# not match the XML file. It is written to the package directory or, if that
+# is not writable, to a user specific cache directory. It can also be created
+# in advance (i. e. at build time) by running this module as a script.
+#
+# In order to avoid hashing the XML file in every process, the binary file is
+# taken to match if the size and modification time recorded in it equal those
+# of the XML file. Only if they differ (for example because the package has
+# been re-installed), the XML file is hashed and compared to the recorded
+# digest. If the digest matches, the binary file is re-written with the new
+# size and modification time (if possible), so that the XML file is not hashed
+# again.
+#
+# Two backends are available for holding the table in a process:
+#
+# 'memory': the binary file is read into a `bytes` object (default)
+# 'mmap':   the binary file is memory-mapped and searched in place, so that
+#           all processes using the table share a single copy of it in the
+#           OS page cache (useful for servers running many worker processes)
+#
+# The backend can be selected by calling `set_backend` or by setting the
+# environment variable IDENTIFIERS_GS1_BACKEND.
+
+cache_file_name = os.path.join(pkg_dir, "GS1_CP_Ranges.bin")
+
+KEY_WIDTH = 12
+_MAGIC = b'GS1CPT'
+_FORMAT_VERSION = 3
+_BYTE_ORDER = sys.byteorder[0].encode()
+_header = struct.Struct('<6sHc32sqqII')
+_N_DIGITS = 10
+
+
+def _user_cache_file_name() -> str:
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'identifiers',
+                        os.path.basename(cache_file_name))
+
+
+def _xml_digest(xml_file_name: str) -> bytes:
+    with open(xml_file_name, 'rb') as xml_file:
+        return sha256(xml_file.read()).digest()
+
+
+class _XMLSource:
+
+    """Size, modification time and digest of the XML file.
+
+    The digest is calculated on first access only.
+    """
+
+    __slots__ = ('file_name', 'size', 'mtime_ns', '_digest')
+
+    def __init__(self, xml_file_name: str) -> None:
+        stat = os.stat(xml_file_name)
+        self.file_name = xml_file_name
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self._digest: Optional[bytes] = None
+
+    @property
+    def digest(self) -> bytes:
+        """SHA-256 digest of the XML file."""
+        if self._digest is None:
+            self._digest = _xml_digest(self.file_name)
+        return self._digest
+
+
+def _iter_prefixes(xml_file_name: str) -> Iterator[Tuple[str, int]]:
+    root = ETree.parse(xml_file_name).getroot()
+    for elem in root:
+        yield elem.get('prefix'), int(elem.get('gcpLength'))
+
+
+def _load_prefix_list() -> List[Tuple[str, int]]:
+    return list(_iter_prefixes(file_name))
+
+
+class _PrefixTable:
+
+    """Table of GS1 prefixes with digit trie index.
+
+    The table operates directly on the buffer given, which may be a `bytes`
+    object or a memory-mapped file.
+    """
+
+    __slots__ = ('_buf', '_count', '_keys_start', '_lengths_start', '_nodes')
+
+    def __init__(self, buf: Union[bytes, mmap]) -> None:
+        _, _, _, _, _, _, count, n_nodes = _header.unpack_from(buf)
+        keys_start = _header.size
+        lengths_start = keys_start + count * KEY_WIDTH
+        nodes_start = _align(lengths_start + count)
+        nodes_end = nodes_start + n_nodes * _N_DIGITS * 4
+        if len(buf) != nodes_end:
+            raise ValueError("Corrupt GS1 prefix table.")
+        self._buf = buf
+        self._count = count
+        self._keys_start = keys_start
+        self._lengths_start = lengths_start
+        self._nodes = memoryview(buf)[nodes_start:nodes_end].cast('i')
+
+    def find(self, gs1_num_id: str) -> Optional[Tuple[str, int]]:
+        """Return the prefix matching `gs1_num_id` and the length of the
+        company prefix belonging to it, or None if no matching prefix is
+        found."""
+        nodes = self._nodes
+        idx = 0
+        for byte in gs1_num_id[:KEY_WIDTH].encode('ascii', 'replace'):
+            digit = byte - 48   # ord('0')
+            if not 0 <= digit <= 9:
+                break
+            val = nodes[idx + digit]
+            if val > 0:
+                idx = val
+            elif val < 0:
+                val = ~val
+                return gs1_num_id[:val >> 4], val & 0xF
+            else:
+                break
+        return None
+
+    def find_bisect(self, gs1_num_id: str) -> Optional[Tuple[str, int]]:
+        """Return the prefix matching `gs1_num_id` and the length of the
+        company prefix belonging to it, or None if no matching prefix is
+        found.
+
+        Reference implementation of :meth:`find`, doing a binary search on
+        the sorted keys.
+        """
+        key = gs1_num_id[:KEY_WIDTH].encode('ascii', 'replace') \
+            .ljust(KEY_WIDTH, b'\0')
+        buf = self._buf
+        keys_start = self._keys_start
+        # search the last prefix <= key
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = keys_start + mid * KEY_WIDTH
+            if key < buf[start:start + KEY_WIDTH]:
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo > 0:
+            idx = lo - 1
+            start = keys_start + idx * KEY_WIDTH
+            prefix = buf[start:start + KEY_WIDTH].rstrip(b'\0')
+            if key.startswith(prefix):
+                return (prefix.decode('ascii'),
+                        buf[self._lengths_start + idx])
+        return None
+
+
+def _align(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+def _build_trie(prefix_list: List[Tuple[str, int]]) -> array:
+    empty_node = array('i', bytes(_N_DIGITS * 4))
+    nodes = array('i', empty_node)
+    for prefix, cp_length in prefix_list:
+        idx = 0
+        for digit in prefix[:-1]:
+            slot = idx + int(digit)
+            idx = nodes[slot]
+            if idx == 0:
+                idx = nodes[slot] = len(nodes)
+                nodes.extend(empty_node)
+            elif idx < 0:
+                raise ValueError(f"Ambiguous prefix: '{prefix}'.")
+        slot = idx + int(prefix[-1])
+        if nodes[slot] != 0:
+            raise ValueError(f"Ambiguous prefix: '{prefix}'.")
+        nodes[slot] = ~(len(prefix) << 4 | cp_length)
+    return nodes
+
+
+def _pack_header(source: _XMLSource, count: int, n_nodes: int) -> bytes:
+    return _header.pack(_MAGIC, _FORMAT_VERSION, _BYTE_ORDER, source.digest,
+                        source.size, source.mtime_ns, count, n_nodes)
+
+
+def _compile_prefix_table(source: _XMLSource) -> bytes:
+    prefix_list = list(_iter_prefixes(source.file_name))
+    keys = b''.join(prefix.encode('ascii').ljust(KEY_WIDTH, b'\0')
+                    for prefix, _ in prefix_list)
+    lengths = bytes(cp_length for _, cp_length in prefix_list)
+    nodes = _build_trie(prefix_list)
+    header = _pack_header(source, len(prefix_list), len(nodes) // _N_DIGITS)
+    table = header + keys + lengths
+    padding = bytes(_align(len(table)) - len(table))
+    return table + padding + nodes.tobytes()
+
+
+def _stamp_matches(buf: Union[bytes, mmap], source: _XMLSource) -> bool:
+    """Return True if size and modification time recorded in `buf` equal
+    those of `source`."""
+    _, _, _, _, size, mtime_ns, _, _ = _header.unpack_from(buf)
+    return size == source.size and mtime_ns == source.mtime_ns
+
+
+def _restamp(buf: Union[bytes, mmap], source: _XMLSource) -> bytes:
+    """Return copy of `buf` with size and modification time of `source`."""
+    _, _, _, _, _, _, count, n_nodes = _header.unpack_from(buf)
+    return _pack_header(source, count, n_nodes) + buf[_header.size:]
+
+
+def _check_header(buf: Union[bytes, mmap], source: _XMLSource) -> bool:
+    try:
+        magic, version, byte_order, digest, _, _, _, _ = \
+            _header.unpack_from(buf)
+    except struct.error:
+        return False
+    if (magic, version, byte_order) != (_MAGIC, _FORMAT_VERSION, _BYTE_ORDER):
+        return False
+    # the XML file is only hashed if its size or modification time differ
+    return _stamp_matches(buf, source) or digest == source.digest
+
+
+def _read_prefix_table(cache_file: str,
+                       source: _XMLSource) -> Optional[bytes]:
+    try:
+        with open(cache_file, 'rb') as file:
+            buf = file.read()
+    except OSError:
+        return None
+    return buf if _check_header(buf, source) else None
+
+
+def _map_prefix_table(cache_file: str, source: _XMLSource) -> Optional[mmap]:
+    try:
+        with open(cache_file, 'rb') as file:
+            buf = mmap(file.fileno(), 0, access=ACCESS_READ)
+    except (OSError, ValueError):   # ValueError: file is empty
+        return None
+    if _check_header(buf, source):
+        return buf
+    buf.close()
+    return None
+
+
+def _write_prefix_table(cache_file: str, buf: bytes) -> bool:
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, 'wb') as file:
+            file.write(buf)
+        # atomically replace an outdated file, so that concurrently
+        # starting processes never see a partially written one
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def compile_prefix_table(xml_file_name: Optional[str] = None,
+                         cache_file: Optional[str] = None) -> str:
+    """Compile the GS1 prefix XML file into its binary form.
+
+    Args:
+        xml_file_name (str): path of the XML file (default: the file
+            distributed with this package)
+        cache_file (str): path of the binary file to be written (default:
+            file in the package directory or, if that is not writable, in
+            the user's cache directory)
+
+    Returns:
+        str: path of the binary file written
+
+    Raises:
+        OSError: binary file could not be written
+    """
+    buf = _compile_prefix_table(_XMLSource(xml_file_name or file_name))
+    candidates = [cache_file] if cache_file else [cache_file_name,
+                                                  _user_cache_file_name()]
+    for candidate in candidates:
+        if _write_prefix_table(candidate, buf):
+            return candidate
+    raise OSError(f"Unable to write '{candidates[-1]}'.")
+
+
+BACKENDS = ('memory', 'mmap')
+
+
+def _load_prefix_table(backend: str) -> _PrefixTable:
+    source = _XMLSource(file_name)
+    candidates = (cache_file_name, _user_cache_file_name())
+    read = _map_prefix_table if backend == 'mmap' else _read_prefix_table
+    for candidate in candidates:
+        buf = read(candidate, source)
+        if buf is not None:
+            try:
+                prefix_table = _PrefixTable(buf)
+            except ValueError:      # corrupt file, ignore it
+                continue
+            if not _stamp_matches(buf, source):
+                # XML file has been touched, but not changed: record its
+                # size and modification time, so that it is not hashed again
+                # (an existing memory map stays valid, as the file is
+                # replaced)
+                _write_prefix_table(candidate, _restamp(buf, source))
+            return prefix_table
+    buf = _compile_prefix_table(source)
+    for candidate in candidates:
+        if _write_prefix_table(candidate, buf):
+            if backend == 'mmap':
+                mapped_buf = _map_prefix_table(candidate, source)
+                if mapped_buf is not None:
+                    return _PrefixTable(mapped_buf)
+            break
+    # no binary file available, fall back to holding the table in memory
+    return _PrefixTable(buf)
+
+
+# The table is loaded on first use (or by calling `preload`), so that
+# importing this module does not have to pay for loading it.
+_backend = os.environ.get('IDENTIFIERS_GS1_BACKEND', 'memory')
+if _backend not in BACKENDS:
+    raise ValueError(f"Unknown backend: '{_backend}' (given by environment "
+                     f"variable IDENTIFIERS_GS1_BACKEND).")
+_prefix_table: Optional[_PrefixTable] = None
+_load_lock = Lock()
+
+
+def _get_prefix_table() -> _PrefixTable:
+    global _prefix_table
+    prefix_table = _prefix_table
+    if prefix_table is None:
+        with _load_lock:
+            # another thread may have loaded the table while we were waiting
+            if _prefix_table is None:
+                _prefix_table = _load_prefix_table(_backend)
+            prefix_table = _prefix_table
+    return prefix_table
+
+
+def get_backend() -> str:
+    """Return the name of the backend used to hold the GS1 company prefix
+    table."""
+    return _backend
+
+
+def set_backend(backend: str) -> None:
+    """Set the backend used to hold the GS1 company prefix table.
+
+    Args:
+        backend (str): 'memory' (table is read into memory) or 'mmap' (table
+            is memory-mapped, so that it is shared between processes)
+
+    Raises:
+        ValueError: unknown backend given
+
+    An already loaded table and the memoized lookups are discarded, the
+    table is loaded again on next use.
+    """
+    global _backend, _prefix_table
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: '{backend}'.")
+    with _load_lock:
+        _backend = backend
+        _prefix_table = None
+    company_prefix_cache.clear()
+
+
+def preload() -> None:
+    """Load the GS1 company prefix table, if not already done.
+
+    Normally, the table is loaded on the first call of
+    :func:`lookup_company_prefix`. Calling this function allows to pay the
+    cost of loading in advance, for example when starting a server process.
+    """
+    _get_prefix_table()
+
+
+def _find_company_prefix(gs1_num_id: str) \
+        -> Tuple[Optional[Tuple[str, int]], int]:
+    res = _get_prefix_table().find(gs1_num_id)
+    # the result depends only on the digits of the matching prefix
+    return res, 0 if res is None else len(res[0])
+
+
+# Results of the lookups are memoized keyed by the first 7 digits, the most
+# common length of company prefixes; the matching GS1 prefix lies within
+# them for all but a tiny fraction of the number space.
+company_prefix_cache = PrefixCache(_find_company_prefix, 7)
+
+
+def find_company_prefix(gs1_num_id: str) -> Optional[Tuple[str, int]]:
+    """Return the GS1 prefix matching `gs1_num_id` and the length of the
+    company prefix belonging to it (0 if the prefix is excluded from use),
+    or None if no matching prefix is defined."""
+    return company_prefix_cache(gs1_num_id)
 
 
 def lookup_company_prefix(gs1_num_id: str) -> int:
     """Validate company prefix of given `gs1_num_id`."""
-    idx = bisect(prefix_list, (gs1_num_id,)) - 1
-    prefix, cp_length = prefix_list[idx]
-    if gs1_num_id.startswith(prefix):
-        if cp_length > 0:
-            return cp_length
-        raise ValueError(f"Excluded prefix: '{prefix}'.")
-    raise ValueError("Undefined prefix.")
+    res = company_prefix_cache(gs1_num_id)
+    if res is None:
+        raise IdentifierError(UNDEFINED_PREFIX, "Undefined prefix.")
+    prefix, cp_length = res
+    if cp_length > 0:
+        return cp_length
+    raise IdentifierError(EXCLUDED_PREFIX, f"Excluded prefix: '{prefix}'.")
+
+
+# The GS1 check digit is calculated from the digits weighted alternately by
+# 3 and 1, starting with 3 at the rightmost digit. For each length up to the
+# length of the longest GS1 numerical identifier without check digit (SSCC:
+# 17), the slices selecting the digits weighted by 3 and by 1 are
+# precomputed, together with the corresponding weighted sum of the ascii
+# code of '0'. This allows to calculate the checksum directly from the bytes
+# of the digit string, without converting the digits one by one.
+def _check_digit_params(n_digits: int) -> Tuple[slice, slice, int]:
+    by3 = slice((n_digits - 1) % 2, n_digits, 2)
+    by1 = slice(n_digits % 2, n_digits, 2)
+    offset = ord('0') * (3 * ((n_digits + 1) // 2) + n_digits // 2)
+    return by3, by1, offset
+
+
+_CHECK_DIGIT_PARAMS = [_check_digit_params(n_digits)
+                       for n_digits in range(18)]
+# check digit indexed by checksum % 10
+_CHECK_DIGITS = '0987654321'
+
+
+def calc_check_digit(digits: str) -> str:
+    """Calculate and return the GS1 check digit for `digits`."""
+    if digits.isascii() and digits.isdigit():
+        n_digits = len(digits)
+        try:
+            by3, by1, offset = _CHECK_DIGIT_PARAMS[n_digits]
+        except IndexError:
+            by3, by1, offset = _check_digit_params(n_digits)
+        data = digits.encode()
+        return _CHECK_DIGITS[(3 * sum(data[by3]) + sum(data[by1]) - offset)
+                             % 10]
+    # other numerical characters are converted one by one (raises
+    # ValueError for non-numerical characters)
+    ints = [int(d) for d in digits]
+    n_digits = len(ints)
+    odds = slice((n_digits - 1) % 2, n_digits, 2)
+    even = slice(n_digits % 2, n_digits, 2)
+    checksum = 3 * sum(ints[odds]) + sum(ints[even])
+    return str(-checksum % 10)
+
+
+def check_digits_array(codes: Any) -> Tuple[Any, Any]:
+    """Check the GS1 check digits of all elements of `codes` at once.
+
+    Args:
+        codes: array-like of GS1 numerical identifiers including their check
+            digit, preferably a numpy array of fixed-width bytes (for example
+            created by `numpy.array(codes, dtype='S13')`); identifiers of
+            different lengths may be mixed
+
+    Returns:
+        tuple of two numpy arrays with the shape of `codes`: a boolean mask
+        telling which elements have a correct check digit and the expected
+        check digits (as int8, -1 for elements containing characters other
+        than digits 0-9 or having less than 2 digits)
+
+    Raises:
+        ImportError: numpy is not installed
+        TypeError: `codes` can not be converted to an array of bytes
+
+    Note: Only the check digits are validated, not the company prefixes.
+    """
+    import numpy as np
+    codes = np.asarray(codes)
+    if codes.dtype.kind == 'U':
+        codes = codes.astype('S')
+    elif codes.dtype.kind != 'S':
+        raise TypeError("Argument must be an array of 'bytes' or 'str'.")
+    shape = codes.shape
+    n_codes = codes.size
+    width = codes.dtype.itemsize
+    chars = np.ascontiguousarray(codes).reshape(n_codes) \
+        .view(np.uint8).reshape(n_codes, width)
+    # as uint8, all non-digits wrap around to values > 9
+    digits = chars - np.uint8(ord('0'))
+    is_digit = digits < 10
+    if is_digit.all():
+        # fast path: all codes have the full width
+        lengths = np.full(n_codes, width)
+        is_valid_code = np.full(n_codes, width >= 2)
+        # weights 3 and 1 alternating from the right, 0 for the check digit
+        weights = np.zeros(width, dtype=np.uint8)
+        weights[-2::-2] = 3
+        weights[-3::-2] = 1
+    else:
+        # shorter codes are padded with NUL bytes
+        is_char = chars != 0
+        lengths = np.where(is_char.any(axis=1),
+                           width - is_char[:, ::-1].argmax(axis=1), 0)
+        dist = lengths[:, None] - 1 - np.arange(width)
+        in_code = dist >= 0
+        is_valid_code = ((is_digit | ~in_code).all(axis=1) & (lengths >= 2))
+        weights = np.where(dist > 0, 1 + 2 * (dist & 1), 0).astype(np.uint8)
+        weights[~is_digit] = 0
+    checksums = (digits * weights).sum(axis=1, dtype=np.int32)
+    check_digits = np.where(is_valid_code, -checksums % 10, -1) \
+        .astype(np.int8)
+    actual = digits[np.arange(n_codes), np.maximum(lengths - 1, 0)]
+    valid = is_valid_code & (actual == check_digits)
+    return valid.reshape(shape), check_digits.reshape(shape)
+
+
+if __name__ == '__main__':
+    print(f"Written '{compile_prefix_table()}'.")
@@ -18,19 +18,49 @@
 
 
 # standard library imports
-from string import ascii_uppercase, digits
-from typing import Tuple
+from string import ascii_lowercase, ascii_uppercase, digits
+from typing import Any, Iterable, List, Optional, Tuple
 
 
 _ALPHABET = digits + ascii_uppercase
 
 
+# The check digits are derived from the remainder modulo 97 of the number
+# resulting from the string bban + country code + '00', after replacing
+# each letter by two digits (A = 10, B = 11, ..., Z = 35). Instead of
+# building this number, the remainder is computed character by character:
+# appending a character with value v to a number with remainder r results
+# in the remainder (r * 10 + v) % 97 for a digit and (r * 100 + v) % 97 for
+# a letter. These are precomputed for each character and each remainder, so
+# that no big integers or intermediate strings are needed.
+_MOD97_NEXT = {
+    char: [(rem * (10 if idx < 10 else 100) + idx) % 97 for rem in range(97)]
+    for idx, char in enumerate(_ALPHABET)
+}
+# check digits resulting from the remainder of bban + country code
+_CHECK_DIGITS = ['%02i' % (98 - rem * 100 % 97) for rem in range(97)]
+
+
+def _calc_check_digits(string: str) -> Optional[str]:
+    """Return IBAN check digits for `string` (bban + country code) or None,
+    if it contains characters other than digits and upper case ascii
+    letters."""
+    mod97_next = _MOD97_NEXT
+    rem = 0
+    try:
+        for char in string:
+            rem = mod97_next[char][rem]
+    except KeyError:
+        return None
+    return _CHECK_DIGITS[rem]
+
+
 def calc_iban_check_digits(country_code: str, bban: str) -> str:
     """Calculate IBAN check digits from `country_code` and `bban`."""
-    string = bban.upper() + country_code + '00'
-    check_num = int(''.join((str(_ALPHABET.index(char))
-                             for char in string)))
-    return '%02i' % (98 - check_num % 97)
+    check_digits = _calc_check_digits(bban.upper() + country_code)
+    if check_digits is None:
+        raise ValueError("IBAN must only contain digits and ascii letters.")
+    return check_digits
 
 
 def split_iban(iban: str) -> Tuple[str, str, str]:
@@ -44,3 +74,86 @@ def check_iban_check_digits(iban: str) -> bool:
     country_code, check_digits, bban = split_iban(iban)
     corr_check_digits = calc_iban_check_digits(country_code, bban)
     return check_digits == corr_check_digits
+
+
+def check_iban_check_digits_many(ibans: Iterable[str]) \
+        -> Tuple[List[bool], List[Optional[str]]]:
+    """Check the check digits of all IBANs in `ibans`.
+
+    Returns a tuple of two lists, holding for each IBAN whether it has
+    correct check digits and the correct check digits (None for IBANs
+    containing characters other than digits and ascii letters).
+    """
+    valid = []
+    corr_check_digits = []
+    for iban in ibans:
+        check_digits = _calc_check_digits(iban[4:].upper() + iban[:2])
+        valid.append(check_digits is not None and iban[2:4] == check_digits)
+        corr_check_digits.append(check_digits)
+    return valid, corr_check_digits
+
+
+def check_iban_check_digits_array(ibans: Any) -> Tuple[Any, Any]:
+    """Check the check digits of all elements of `ibans` at once.
+
+    Args:
+        ibans: array-like of IBANs (without surrounding whitespace),
+            preferably a numpy array of fixed-width bytes (for example
+            created by `numpy.array(ibans, dtype='S34')`) or a 2-dimensional
+            numpy array of type uint8 holding the characters of one IBAN per
+            row, right-padded with NUL bytes
+
+    Returns:
+        tuple of two 1-dimensional numpy arrays: a boolean mask telling which
+        elements have correct check digits and the correct check digits (as
+        int8, -1 for elements containing characters other than digits and
+        ascii letters)
+
+    Raises:
+        ImportError: numpy is not installed
+        TypeError: `ibans` can not be converted to an array of uint8
+    """
+    import numpy as np
+    ibans = np.asarray(ibans)
+    if ibans.dtype.kind == 'U':
+        ibans = ibans.astype('S')
+    if ibans.dtype.kind == 'S' and ibans.ndim == 1:
+        ibans = np.ascontiguousarray(ibans).view(np.uint8) \
+            .reshape(ibans.size, ibans.dtype.itemsize)
+    if ibans.dtype != np.uint8 or ibans.ndim != 2:
+        raise TypeError("Argument must be a 2-dimensional array of 'uint8' "
+                        "or a 1-dimensional array of 'bytes' or 'str'.")
+    n_ibans, width = ibans.shape
+    # map each byte to the value of the character (0 - 35) and to the
+    # factor needed to append its digits to the remainder (10 or 100);
+    # NUL bytes are skipped (value 0, factor 1), other bytes are invalid
+    values = np.zeros(256, dtype=np.int32)
+    factors = np.zeros(256, dtype=np.int32)
+    factors[0] = 1
+    for idx, char in enumerate(_ALPHABET):
+        values[ord(char)] = idx
+        factors[ord(char)] = 10 if idx < 10 else 100
+    # the country code is not converted to upper case
+    cc_values, cc_factors = values.copy(), factors.copy()
+    for idx, char in enumerate(ascii_lowercase, 10):
+        values[ord(char)] = idx
+        factors[ord(char)] = 100
+    is_valid = np.full(n_ibans, width >= 4)
+    rem = np.zeros(n_ibans, dtype=np.int32)
+    for col in range(4, width):
+        chars = ibans[:, col]
+        factor = factors[chars]
+        is_valid &= factor != 0
+        rem = (rem * factor + values[chars]) % 97
+    for col in range(min(width, 2)):
+        chars = ibans[:, col]
+        factor = cc_factors[chars]
+        is_valid &= factor != 0
+        rem = (rem * factor + cc_values[chars]) % 97
+    check_digits = np.where(is_valid, 98 - rem * 100 % 97, -1) \
+        .astype(np.int8)
+    if width >= 4:
+        given = ibans[:, 2:4].astype(np.int32) - ord('0')
+        is_valid &= ((given >= 0) & (given < 10)).all(axis=1)
+        is_valid &= given[:, 0] * 10 + given[:, 1] == check_digits
+    return is_valid, check_digits
@@ -18,7 +18,77 @@
 
 
 from abc import ABCMeta, abstractmethod
-from typing import Mapping, Optional
+from functools import lru_cache
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+
+# Reason codes returned by `Identifier.validate_many` for invalid input
+INVALID_TYPE = 'type'
+INVALID_FORMAT = 'format'
+INVALID_LENGTH = 'length'
+UNDEFINED_PREFIX = 'prefix'
+EXCLUDED_PREFIX = 'excluded_prefix'
+WRONG_CHECK_DIGIT = 'check_digit'
+INVALID = 'invalid'
+
+
+class IdentifierError(ValueError):
+
+    """Raised when the value given to create an identifier is invalid.
+
+    Args:
+        kind (str): reason code, as returned by
+            :meth:`Identifier.validate_many`
+        msg (str or Callable): message or function returning the message
+        country_code (str): country code of the identifier (optional)
+        rule_idx (int): index of the country specific rule which failed
+            (optional)
+
+    If `msg` is a function, it is called when the exception is converted
+    to a string, so that the cost of building the message is only paid if
+    it is actually used.
+    """
+
+    # The arguments are not copied to attributes by an __init__ method, but
+    # kept in `args`, so that raising an IdentifierError is not more
+    # expensive than raising a plain ValueError.
+
+    @property
+    def kind(self) -> str:
+        """Reason code."""
+        return self.args[0]
+
+    @property
+    def country_code(self) -> Optional[str]:
+        """Country code of the identifier, if given."""
+        args = self.args
+        return args[2] if len(args) > 2 else None
+
+    @property
+    def rule_idx(self) -> Optional[int]:
+        """Index of the country specific rule which failed, if given."""
+        args = self.args
+        return args[3] if len(args) > 3 else None
+
+    def __str__(self) -> str:
+        """str(self)"""
+        args = self.args
+        msg = args[1]
+        if not isinstance(msg, str):
+            msg = msg()
+            self.args = (args[0], msg) + args[2:]
+        return msg
+
+    def __repr__(self) -> str:
+        """repr(self)"""
+        str(self)   # render message
+        return super().__repr__()
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        """Return class and args for pickling, with the message rendered,
+        as the function building it may not be picklable."""
+        str(self)
+        return self.__class__, self.args
 
 
 class Identifier(metaclass=ABCMeta):
@@ -31,6 +101,131 @@ class Identifier(metaclass=ABCMeta):
     def __init__(self, *args, **kwds) -> None:
         pass
 
+    @classmethod
+    def _validate(cls, arg: Any) -> Optional[str]:
+        """Return None if `arg` is a valid string representation of an
+        instance of `cls`, otherwise a reason code."""
+        try:
+            cls(arg)
+        except TypeError:
+            return INVALID_TYPE
+        except IdentifierError as exc:
+            return exc.kind
+        except ValueError:
+            return INVALID
+        return None
+
+    @classmethod
+    def from_trusted(cls, raw_id: str) -> "Identifier":
+        """Create an instance of `cls` from `raw_id` without validating it.
+
+        Args:
+            raw_id (str): raw id of an instance of `cls`, as held by
+                instances created by the constructor (see :meth:`__repr__`)
+
+        Returns:
+            instance of :class:`cls`
+
+        `raw_id` is neither validated nor normalized, so it must be taken
+        from a valid instance of `cls`, for example one which has been stored
+        in a database after validation. State derived from `raw_id` (like the
+        index of the company prefix of GS1 identifiers) is computed on first
+        use.
+        """
+        obj = cls.__new__(cls)
+        obj._id = raw_id
+        return obj
+
+    @classmethod
+    def enable_interning(cls, maxsize: int = 1024) -> None:
+        """Enable interning of instances of `cls`.
+
+        Args:
+            maxsize (int): maximal number of instances held in the cache
+
+        When interning is enabled, :meth:`interned` returns the existing
+        instance for a string already seen, without validating the string
+        again. The least recently used instances are evicted from the cache
+        when it is full. Calling the class itself always creates a new
+        instance.
+
+        Interning is enabled per class, it is not inherited by subclasses.
+        Calling this method again replaces the cache by an empty one with
+        the given size.
+        """
+        if maxsize < 1:
+            raise ValueError("'maxsize' must be > 0.")
+        cls._intern = lru_cache(maxsize)(cls)
+
+    @classmethod
+    def disable_interning(cls) -> None:
+        """Disable interning of instances of `cls` and clear the cache."""
+        try:
+            del cls._intern
+        except AttributeError:
+            pass
+
+    @classmethod
+    def interned(cls, arg: str) -> "Identifier":
+        """Return an instance of `cls` created from `arg`, taken from the
+        interning cache of `cls`.
+
+        Args:
+            arg (str): string representation of an instance of `cls`
+
+        Returns:
+            instance of :class:`cls`
+
+        If interning is not enabled for `cls` (see :meth:`enable_interning`)
+        or `arg` is not a string, a new instance is created.
+        """
+        # The cache is looked up in the class dict, so that interning is not
+        # inherited by subclasses.
+        intern = cls.__dict__.get('_intern')
+        if intern is None or arg.__class__ is not str:
+            return cls(arg)
+        return intern(arg)
+
+    @classmethod
+    def interning_info(cls) -> Optional[Tuple[int, int, int, int]]:
+        """Return statistics of the interning cache of `cls`.
+
+        Returns:
+            named tuple (hits, misses, maxsize, currsize) or None, if
+                interning is not enabled for `cls`
+        """
+        intern = cls.__dict__.get('_intern')
+        if intern is None:
+            return None
+        return intern.cache_info()
+
+    @classmethod
+    def validate_many(cls, args: Iterable[Any]) -> List[Optional[str]]:
+        """Validate string representations of instances of `cls`.
+
+        Args:
+            args (Iterable): strings to be validated
+
+        Returns:
+            list: one entry per element of `args`, None if the element is
+                valid, otherwise a code giving the reason why it is invalid
+
+        Reason codes:
+
+        - 'type': element is not a string
+        - 'format': element contains invalid characters or does not match
+          the required format
+        - 'length': element has an invalid length
+        - 'prefix': element contains an undefined prefix
+        - 'excluded_prefix': element contains a prefix excluded from use
+        - 'check_digit': element contains a wrong check digit
+        - 'invalid': element is invalid for some other reason
+
+        No exceptions are raised for invalid elements.
+        """
+        validate = cls._validate
+        return [validate(arg) for arg in args]
+
     def __copy__(self) -> "Identifier":
         """copy(self)
 
@@ -45,12 +240,46 @@ class Identifier(metaclass=ABCMeta):
 
     def __hash__(self) -> int:
         """hash(self)"""
-        return hash(self.__class__.__name__ + str(self._id))
+        return hash((self.__class__, self._id))
 
-    def __eq__(self, other) -> bool:
+    # Identifiers are compared by their raw id, which avoids creating the
+    # formatted string representation (for example with separators) per
+    # comparison. Only instances of the same class are comparable.
+
+    # noinspection PyProtectedMember
+    def __eq__(self, other: Any) -> bool:
         """self == other"""
-        # noinspection PyProtectedMember
-        return self.__class__ == other.__class__ and self._id == other._id
+        if self.__class__ is other.__class__:
+            return self._id == other._id
+        return NotImplemented
+
+    # noinspection PyProtectedMember
+    def __lt__(self, other: Any) -> bool:
+        """self < other"""
+        if self.__class__ is other.__class__:
+            return self._id < other._id
+        return NotImplemented
+
+    # noinspection PyProtectedMember
+    def __le__(self, other: Any) -> bool:
+        """self <= other"""
+        if self.__class__ is other.__class__:
+            return self._id <= other._id
+        return NotImplemented
+
+    # noinspection PyProtectedMember
+    def __gt__(self, other: Any) -> bool:
+        """self > other"""
+        if self.__class__ is other.__class__:
+            return self._id > other._id
+        return NotImplemented
+
+    # noinspection PyProtectedMember
+    def __ge__(self, other: Any) -> bool:
+        """self >= other"""
+        if self.__class__ is other.__class__:
+            return self._id >= other._id
+        return NotImplemented
 
     @abstractmethod
     def __str__(self) -> str:
@@ -19,9 +19,11 @@
 
 import os.path
 from bisect import bisect
-from typing import Iterator, Tuple
+from typing import Iterator, Optional, Tuple
 from xml.etree import ElementTree as ETree
 
+from .identifier import EXCLUDED_PREFIX, IdentifierError, UNDEFINED_PREFIX
+
 
 def _iter_rules(root: ETree.Element) -> Iterator:
     for elem in root.findall('RegistrationGroups/Group'):
@@ -47,15 +49,47 @@ root = etree.getroot()
 rule_list = list(_iter_rules(root))
 
 
+_lower_prefixes = [rule[0] for rule in rule_list]
+
+
+def _find_rule(digits: str) -> Tuple[str, str, int, int]:
+    # '\x7f' sorts after all digits, so that the rule is also found if
+    # `digits` is shorter than its bounds
+    idx = max(bisect(_lower_prefixes, digits + '\x7f') - 1, 0)
+    return rule_list[idx]
+
+
+def _in_range(lower_prefix: str, upper_prefix: str, digits: str) -> bool:
+    # the bounds of a rule apply to the leading digits of the same length
+    n_digits = len(lower_prefix)
+    key = digits[:n_digits]
+    if len(key) < n_digits:
+        n_digits = len(key)
+        lower_prefix = lower_prefix[:n_digits]
+        upper_prefix = upper_prefix[:n_digits]
+    return lower_prefix <= key <= upper_prefix
+
+
+def find_isbn_prefix(digits: str) -> Optional[Tuple[int, int]]:
+    """Return registrant index and item index of `digits` (item index 0, if
+    the prefix range is excluded from use), or None if `digits` does not
+    contain a defined ISBN prefix."""
+    lower_prefix, upper_prefix, registrant_idx, item_idx = _find_rule(digits)
+    if _in_range(lower_prefix, upper_prefix, digits):
+        return registrant_idx, item_idx
+    return None
+
+
 def lookup_isbn_prefix(digits: str) -> Tuple[int, int]:
     """Check ISBN prefix in `digits`."""
-    idx = max(bisect(rule_list, (digits,)) - 1, 0)
-    lower_prefix, upper_prefix, registrant_idx, item_idx = rule_list[idx]
-    if lower_prefix <= digits <= upper_prefix:
+    lower_prefix, upper_prefix, registrant_idx, item_idx = _find_rule(digits)
+    if _in_range(lower_prefix, upper_prefix, digits):
         if item_idx > 0:
             return registrant_idx, item_idx
-        raise ValueError(f"Excluded prefix range: '{lower_prefix}' - "
-                         f"'{upper_prefix}'.")
+        raise IdentifierError(EXCLUDED_PREFIX,
+                              f"Excluded prefix range: '{lower_prefix}' - "
+                              f"'{upper_prefix}'.")
     if lower_prefix[:3] != digits[:3]:
-        raise ValueError("Undefined prefix.")
-    raise ValueError("Undefined registration group or registrant.")
+        raise IdentifierError(UNDEFINED_PREFIX, "Undefined prefix.")
+    raise IdentifierError(UNDEFINED_PREFIX,
+                          "Undefined registration group or registrant.")
@@ -18,7 +18,9 @@
 
 
 from bisect import bisect
-from typing import Tuple
+from typing import Optional, Tuple
+
+from .identifier import IdentifierError, UNDEFINED_PREFIX
 
 rule_list = [
     ('979000000000', '979009999999', 4, 7),
@@ -29,10 +31,24 @@ rule_list = [
 ]
 
 
-def lookup_ismn_prefix(digits: str) -> Tuple[int, int]:
-    """Check ISMN prefix in `digits`."""
-    idx = bisect(rule_list, (digits,)) - 1
+_lower_prefixes = [rule[0] for rule in rule_list]
+
+
+def find_ismn_prefix(digits: str) -> Optional[Tuple[int, int]]:
+    """Return registrant index and item index of `digits`, or None if
+    `digits` does not contain the ISMN prefix."""
+    idx = bisect(_lower_prefixes, digits) - 1
     lower_prefix, upper_prefix, registrant_idx, item_idx = rule_list[idx]
-    if lower_prefix <= digits <= upper_prefix:
+    # the bounds of a rule apply to the leading digits of the same length
+    if lower_prefix <= digits[:len(upper_prefix)] <= upper_prefix:
         return registrant_idx, item_idx
-    raise ValueError("ISMN prefix must be '9790'.")
+    return None
+
+
+def lookup_ismn_prefix(digits: str) -> Tuple[int, int]:
+    """Check ISMN prefix in `digits`."""
+    res = find_ismn_prefix(digits)
+    if res is None:
+        raise IdentifierError(UNDEFINED_PREFIX,
+                              "ISMN prefix must be '9790'.")
+    return res
@@ -20,8 +20,8 @@ identification numbers"""
 
 
 # standard library imports
-from string import ascii_uppercase, digits
-from typing import Optional
+from string import ascii_lowercase, ascii_uppercase, digits
+from typing import Any, Dict, List, Optional, Tuple
 
 # third-party imports
 
@@ -125,6 +125,23 @@ _PRE_CALC = [
 ]
 
 
+# In order to avoid searching the alphabet for each character, the entries
+# of _PRE_CALC are looked up by the ascii code of the character, using one of
+# the following lists of 256 entries (one allowing only digits, the other
+# also upper case letters). Unallowed characters are mapped to an empty
+# tuple, so that indexing the entry raises an IndexError.
+
+def _pre_calc_by_code(alphabet: str) -> List[Tuple[Tuple[int, int], ...]]:
+    pre_calc_by_code: List[Tuple[Tuple[int, int], ...]] = [()] * 256
+    for idx, char in enumerate(alphabet):
+        pre_calc_by_code[ord(char)] = _PRE_CALC[idx]
+    return pre_calc_by_code
+
+
+_PRE_CALC_BY_CODE = _pre_calc_by_code(_ALPHABET)
+_PRE_CALC_BY_CODE_NUM_ONLY = _pre_calc_by_code(_ALPHABET[:10])
+
+
 def luhn(base: str, num_only: Optional[bool] = False,
          allow_lower_case: Optional[bool] = False) -> int:
     """Return the Luhn check digit for the given string.
@@ -142,19 +159,18 @@ def luhn(base: str, num_only: Optional[bool] = False,
         ValueError: given `base` contains an unallowed character
     """
     if num_only:
-        alphabet = _ALPHABET[:10]
+        pre_calc = _PRE_CALC_BY_CODE_NUM_ONLY
     else:
-        alphabet = _ALPHABET
+        pre_calc = _PRE_CALC_BY_CODE
     if allow_lower_case:
         base = base.upper()
     try:
-        pre_calc = (_PRE_CALC[alphabet.index(c)] for c in reversed(base))
         cum = 0
         parity = 1
-        for elem in pre_calc:
-            val, parity = elem[parity]
+        for code in reversed(str.encode(base, 'ascii')):
+            val, parity = pre_calc[code][parity]
             cum += val
-    except ValueError:
+    except (IndexError, UnicodeEncodeError):
         pass    # fall through
     else:
         return 10 - cum % 10
@@ -167,3 +183,87 @@ def luhn(base: str, num_only: Optional[bool] = False,
         msg = 'The string given must only contain digits and upper case ' \
               'ascii letters.'
     raise ValueError(msg)
+
+
+# For the vectorized implementation, _PRE_CALC is turned into lookup arrays,
+# created on first use, one for each combination of `num_only` and
+# `allow_lower_case`:
+#
+# indices:  maps each byte value to the index of the character in _ALPHABET,
+#           -1 for unallowed characters and 36 for NUL (used for padding)
+# values:   the values from _PRE_CALC (shape 37 x 2, indexed by index and
+#           parity); row 36 holds zeros for NUL
+# n_digits: the number of digits each index is transformed into (1 for
+#           digits, 2 for letters, 0 for NUL); as the parity flips with each
+#           digit, it is derived from the cumulated number of digits
+_NUL_IDX = len(_ALPHABET)
+_np_tables: Dict[Tuple[bool, bool], Tuple[Any, Any, Any]] = {}
+
+
+def _get_np_tables(num_only: bool, allow_lower_case: bool) \
+        -> Tuple[Any, Any, Any]:
+    try:
+        return _np_tables[(num_only, allow_lower_case)]
+    except KeyError:
+        pass
+    import numpy as np
+    alphabet = _ALPHABET[:10] if num_only else _ALPHABET
+    indices = np.full(256, -1, dtype=np.int8)
+    indices[0] = _NUL_IDX
+    for idx, char in enumerate(alphabet):
+        indices[ord(char)] = idx
+    if allow_lower_case and not num_only:
+        for idx, char in enumerate(ascii_lowercase, 10):
+            indices[ord(char)] = idx
+    values = np.zeros((_NUL_IDX + 1, 2), dtype=np.uint8)
+    values[:_NUL_IDX] = [(odd[0], even[0]) for odd, even in _PRE_CALC]
+    n_digits = np.full(_NUL_IDX + 1, 2, dtype=np.uint8)
+    n_digits[:10] = 1
+    n_digits[_NUL_IDX] = 0
+    tables = indices, values, n_digits
+    _np_tables[(num_only, allow_lower_case)] = tables
+    return tables
+
+
+def luhn_array(chars: Any, num_only: Optional[bool] = False,
+               allow_lower_case: Optional[bool] = False) -> Any:
+    """Return the Luhn check digits for all rows of `chars`.
+
+    Args:
+        chars: 2-dimensional numpy array of type uint8, each row holding the
+            characters of one string (right-padded with NUL bytes, if the
+            strings differ in length), or 1-dimensional array-like of fixed
+            width bytes or str
+        num_only(bool): allow only digits (default: False)
+        allow_lower_case(bool): allow lower case letters (default: False)
+
+    Returns:
+        1-dimensional numpy array of type int8, holding for each row the
+        Luhn check digit, as returned by :func:`luhn`, or -1, if the row
+        contains an unallowed character
+
+    Raises:
+        ImportError: numpy is not installed
+        TypeError: `chars` can not be converted to an array of uint8
+    """
+    import numpy as np
+    chars = np.asarray(chars)
+    if chars.dtype.kind == 'U':
+        chars = chars.astype('S')
+    if chars.dtype.kind == 'S' and chars.ndim == 1:
+        chars = np.ascontiguousarray(chars).view(np.uint8) \
+            .reshape(chars.size, chars.dtype.itemsize)
+    if chars.dtype != np.uint8 or chars.ndim != 2:
+        raise TypeError("Argument must be a 2-dimensional array of 'uint8' "
+                        "or a 1-dimensional array of 'bytes' or 'str'.")
+    indices, values, n_digits = _get_np_tables(bool(num_only),
+                                               bool(allow_lower_case))
+    # process the strings from right to left
+    idx = indices[chars[:, ::-1]]
+    is_valid = (idx >= 0).all(axis=1)
+    idx[idx < 0] = _NUL_IDX
+    ndig = n_digits[idx]
+    # parity is 1 for the rightmost character and flips with each digit
+    parity = (np.cumsum(ndig, axis=1, dtype=np.uint8) - ndig + 1) & 1
+    cum = values[idx, parity].sum(axis=1, dtype=np.int32)
+    return np.where(is_valid, 10 - cum % 10, -1).astype(np.int8)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        prefixcache
+# Purpose:     Memoization of prefix lookups
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Memoization of prefix lookups"""
+
+
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+class PrefixCache:
+
+    """Bounded LRU cache for the results of a prefix lookup.
+
+    Args:
+        lookup (Callable): function taking a digit string and returning a
+            tuple of the result and the number of leading digits the result
+            depends on (0 if the result must not be cached)
+        key_length (int): number of leading digits used as key
+        maxsize (int): maximal number of cached results (0 disables
+            caching)
+
+    The results are cached under the first `key_length` digits, not under
+    the digit string given, so that identifiers sharing these digits hit
+    the same entry. Results depending on more digits are not cached.
+    """
+
+    __slots__ = ('_lookup', '_key_length', '_cached')
+
+    def __init__(self, lookup: Callable[[str], Tuple[Any, int]],
+                 key_length: int, maxsize: int = 4096) -> None:
+        self._lookup = lookup
+        self._key_length = key_length
+        self.resize(maxsize)
+
+    def _lookup_key(self, key: str) -> Any:
+        res, n_digits = self._lookup(key)
+        if 0 < n_digits <= len(key):
+            return res
+        # exceptions are not cached by lru_cache
+        raise _Uncacheable
+
+    def __call__(self, digits: str) -> Any:
+        """Return the result of the lookup for `digits`."""
+        try:
+            return self._cached(digits[:self._key_length])
+        except _Uncacheable:
+            return self._lookup(digits)[0]
+
+    @property
+    def key_length(self) -> int:
+        """Number of leading digits used as key."""
+        return self._key_length
+
+    @property
+    def maxsize(self) -> int:
+        """Maximal number of cached results."""
+        return self._cached.cache_info().maxsize
+
+    def resize(self, maxsize: int) -> None:
+        """Set the maximal number of cached results to `maxsize`.
+
+        The cache is emptied and its statistics are reset. Setting `maxsize`
+        to 0 disables caching.
+        """
+        if maxsize < 0:
+            raise ValueError("'maxsize' must be >= 0.")
+        self._cached = lru_cache(maxsize)(self._lookup_key)
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the statistics."""
+        self._cached.cache_clear()
+
+    def info(self) -> Tuple[int, int, int, int]:
+        """Return named tuple (hits, misses, maxsize, currsize)."""
+        return self._cached.cache_info()
+
+    def hit_rate(self) -> Optional[float]:
+        """Return the share of lookups answered from the cache, or None if
+        no lookup has been done yet."""
+        hits, misses, _, _ = self._cached.cache_info()
+        total = hits + misses
+        return hits / total if total else None
@@ -20,6 +20,14 @@
 import unittest
 from identifiers.banking import BIC, IBAN
 from identifiers.ibanregistry import IBAN_REGISTRY, get_iban_spec
+from identifiers.ibanutils import (
+    check_iban_check_digits_array, check_iban_check_digits_many,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class BICTest(unittest.TestCase):
@@ -135,6 +143,47 @@ class IBANTest(unittest.TestCase):
             for exmpl in iban_spec.examples:
                 self.assertTrue(IBAN(exmpl))
 
+    def test_validate_many(self):
+        self.assertEqual(
+            IBAN.validate_many(['DE89370400440532013000',
+                                'DE88370400440532013000',
+                                'XX89370400440532013000',
+                                'DE8937040044053201300', 17]),
+            [None, 'check_digit', 'prefix', 'format', 'type'])
+        self.assertEqual(BIC.validate_many(['GENODEF1S04', 'GENODEF1S0',
+                                            'GENOXXF1S04']),
+                         [None, 'length', 'prefix'])
+
+    def test_check_digits_many(self):
+        ibans = [exmpl for spec in IBAN_REGISTRY.values()
+                 for exmpl in spec.examples]
+        valid, check_digits = check_iban_check_digits_many(ibans)
+        self.assertTrue(all(valid))
+        self.assertEqual(check_digits, [iban[2:4] for iban in ibans])
+        ibans = ['JO11CBJO0010000000000131AVH302',
+                 'JO12CBJO0010000000000131AVH302',
+                 'mt84malt011000012345mtlcast001s',
+                 'MT84malt011000012345mtlcast001s',
+                 'JO11CBJO00100000000#0131AVH302']
+        self.assertEqual(check_iban_check_digits_many(ibans),
+                         ([True, False, False, True, False],
+                          ['11', '11', None, '84', None]))
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_check_digits_array(self):
+        ibans = [exmpl for spec in IBAN_REGISTRY.values()
+                 for exmpl in spec.examples]
+        ibans += ['JO12CBJO0010000000000131AVH302',
+                  'mt84malt011000012345mtlcast001s',
+                  'MT84malt011000012345mtlcast001s',
+                  'JO11CBJO00100000000#0131AVH302']
+        valid, check_digits = check_iban_check_digits_array(ibans)
+        self.assertEqual((valid.tolist(),
+                          [None if cd < 0 else '%02i' % cd
+                           for cd in check_digits]),
+                         check_iban_check_digits_many(ibans))
+        self.assertRaises(TypeError, check_iban_check_digits_array, [3.5])
+
     def test_str(self):
         iban = IBAN('JO11CBJO0010000000000131AVH302')
         self.assertEqual(str(iban), 'JO11 CBJO 0010 0000 0000 0131 AVH3 02')
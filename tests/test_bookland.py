@@ -17,6 +17,8 @@
 """Test driver for module bookland"""
 
 
+from random import Random
+from string import digits
 import unittest
 from identifiers.bookland import ISBN, ISMN, ISSN, ISSN13
 
@@ -62,6 +64,21 @@ class ISBNTest(unittest.TestCase):
         self.assertEqual(isbn._id, '9789821141239')
         isbn = ISBN('978 982 114 123 9')
         self.assertEqual(isbn._id, '9789821141239')
+        # boundaries of registrant ranges
+        isbn = ISBN('978-0-19-999999')
+        self.assertEqual(isbn._id, '9780199999996')
+        isbn = ISBN('978-0-200-00000')
+        self.assertEqual(isbn._id, '9780200000000')
+
+    def test_validate_many(self):
+        args = ['9783514123458', '978-982-114-123', '978 982 114 123 9',
+                14, '978_982-114-123', '97898211412349', '978 982 114 12',
+                '9769821141239', '978 990 114 123 9', '978-982-1141-23-9',
+                '978 982 114 123 4']
+        self.assertEqual(ISBN.validate_many(args),
+                         [None, None, None, 'type', 'format', 'length',
+                          'length', 'prefix', 'prefix', 'prefix',
+                          'check_digit'])
 
     def test_constructor_4_5(self):
         # wrong type of argument
@@ -96,6 +113,21 @@ class ISBNTest(unittest.TestCase):
         self.assertEqual(isbn.check_digit, '9')
         self.assertEqual(isbn.elements(), ('978', '982', '114', '123', '9'))
 
+    def test_from_trusted(self):
+        for arg in ('978-982-114-123-9', '978-3-514-12345-8',
+                    '978-0-19-999999-6'):
+            isbn = ISBN(arg)
+            trusted = ISBN.from_trusted(isbn._id)
+            self.assertEqual(trusted, isbn)
+            self.assertIsNone(trusted._registrant_idx)
+            self.assertEqual(trusted.registrant, isbn.registrant)
+            self.assertEqual((trusted._registrant_idx, trusted._ref_idx),
+                             (isbn._registrant_idx, isbn._ref_idx))
+            self.assertEqual(trusted.elements(), isbn.elements())
+            self.assertEqual(str(trusted), str(isbn))
+        ismn = ISMN.from_trusted('9790110012345')
+        self.assertEqual(ismn.elements(), ('979', '0', '1100', '1234', '5'))
+
     def test_separated(self):
         isbn = ISBN('978-982-114-123-9')
         self.assertEqual(isbn.separated(), '978-982-114-123-9')
@@ -147,6 +179,11 @@ class ISMNTest(unittest.TestCase):
         self.assertEqual(ismn._id, '9790110012345')
         ismn = ISMN('979 0 1100 1234 5')
         self.assertEqual(ismn._id, '9790110012345')
+        # boundaries of registrant ranges
+        ismn = ISMN('979-0-1000-0000')
+        self.assertEqual(ismn._id, '9790100000000')
+        ismn = ISMN('979-0-099-99999')
+        self.assertEqual(ismn._id, '9790099999996')
 
     def test_constructor_4_5(self):
         # wrong type of argument
@@ -237,6 +274,20 @@ class ISSNTest(unittest.TestCase):
         self.assertTrue(isinstance(gtin, ISSN13))
         self.assertEqual(gtin._id, '9771050124572')
 
+    def test_calc_check_digit(self):
+        rnd = Random(4711)
+        for n_digits in (7, 7, 7, 5, 12):
+            for _ in range(100):
+                base = ''.join(rnd.choice(digits) for _ in range(n_digits))
+                rem = -sum(weight * int(digit) for weight, digit in
+                           zip(range(n_digits + 1, 1, -1), base)) % 11
+                self.assertEqual(ISSN.calc_check_digit(base),
+                                 str(rem) if rem != 10 else 'X')
+        # non-ascii digits
+        self.assertEqual(ISSN.calc_check_digit('\u0661\u0660\u0665\u0660'
+                                              '\u0661\u0662\u0664'), 'X')
+        self.assertRaises(ValueError, ISSN.calc_check_digit, '105012a')
+
     def test_raw_number(self):
         issn = ISSN('1050-124X')
         self.assertEqual(issn.raw_number, '1050124')
@@ -289,6 +340,12 @@ class ISSN13_Test(unittest.TestCase):
             gtin = ISSN13(arg)
             self.assertEqual(gtin._id, '9771050124251')
 
+    def test_validate_many(self):
+        args = ['9771050124008', '1050-124X', '978105012425',
+                '9771050124257', '0317 847X']
+        self.assertEqual(ISSN13.validate_many(args),
+                         [None, None, 'prefix', 'check_digit', 'format'])
+
     def test_elements(self):
         gtin = ISSN13('9771050124008')
         self.assertEqual(gtin.gs1_prefix, '977')
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Name:        test_dateutils
+# Purpose:     Test driver for module dateutils
+#
+# Author:      Michael Amrhein (michael@adrhinum.de)
+#
+# Copyright:   (c) 2021 Michael Amrhein
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ---------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Test driver for module dateutils"""
+
+
+from datetime import date, timedelta
+import unittest
+from identifiers import dateutils
+
+
+class DateUtilsTest(unittest.TestCase):
+
+    def test_is_valid_date(self):
+        for year in range(dateutils.MIN_YEAR - 5, dateutils.MAX_YEAR + 6):
+            for month in range(14):
+                for day in range(33):
+                    try:
+                        date(year, month, day)
+                    except ValueError:
+                        expected = False
+                    else:
+                        expected = True
+                    self.assertEqual(
+                        dateutils.is_valid_date(year, month, day), expected,
+                        (year, month, day))
+
+    def test_today(self):
+        current = date.today()
+        self.assertEqual(dateutils.today(),
+                         (current.year, current.month, current.day))
+        today, refresh_at = dateutils._today, dateutils._refresh_at
+        try:
+            # cached value is used until refresh is due
+            dateutils._today = (2000, 1, 1)
+            self.assertEqual(dateutils.today(), (2000, 1, 1))
+            dateutils._refresh_at = 0.0
+            self.assertEqual(dateutils.today(), today)
+            self.assertGreater(dateutils._refresh_at, 0.0)
+        finally:
+            dateutils._today, dateutils._refresh_at = today, refresh_at
+
+    def test_is_past_date(self):
+        current = date.today()
+        for delta, expected in ((-1, True), (0, False), (1, False)):
+            day = current + timedelta(days=delta)
+            self.assertEqual(
+                dateutils.is_past_date(day.year, day.month, day.day),
+                expected)
+        self.assertFalse(dateutils.is_past_date(2000, 2, 30))
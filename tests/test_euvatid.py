@@ -14,7 +14,10 @@
 # $Revision$
 
 import unittest
-from identifiers.euvatid import EUVATId
+from identifiers.identifier import IdentifierError
+from identifiers.euvatid import (
+    _VAT_ID_RULES, EUVATId, _get_dispatch, check_bg_ucn, get_first_match,
+)
 
 
 _VALID_IDS = [
@@ -479,6 +482,78 @@ class EUVATIdTest(unittest.TestCase):
             # print(s)
             self.assertRaises(ValueError, EUVATId, s)
 
+    def test_birth_date(self):
+        # uniform civil number with birth date in the future / past
+        self.assertEqual(check_bg_ucn('994101000'), 'f')
+        self.assertNotEqual(check_bg_ucn('004101000'), 'f')
+
+    def test_dispatch(self):
+        # the combined pattern selects the same rule as trying the rules
+        # one after the other
+        for s in _VALID_IDS + _INVALID_IDS:
+            country_code, reg_code = s[:2], s[2:]
+            try:
+                rules = _VAT_ID_RULES[country_code]
+            except KeyError:
+                continue
+            match, check = get_first_match(rules, reg_code)
+            pattern, branches = _get_dispatch(country_code)
+            combined_match = pattern.match(reg_code)
+            if match is None:
+                self.assertIsNone(combined_match, s)
+                continue
+            self.assertEqual(combined_match.end(), match.end(), s)
+            check_func, base_idx, check_idx, add_idx, rule_idx = \
+                branches[combined_match.lastindex]
+            self.assertIs(check_func, check, s)
+            self.assertIs(rules[rule_idx][1], check, s)
+            groups = match.groupdict()
+            for name, idx in (('base', base_idx), ('check', check_idx),
+                              ('add', add_idx)):
+                self.assertEqual(combined_match.group(idx) if idx else None,
+                                 groups.get(name), s)
+
+    def test_validate_many(self):
+        self.assertEqual(EUVATId.validate_many(_VALID_IDS),
+                         [None] * len(_VALID_IDS))
+        # non-ascii digits
+        self.assertEqual(EUVATId.validate_many(['ATU\u06613585627']),
+                         ['format'])
+        # results in original order, consistent with constructor
+        mixed = [s for pair in zip(_VALID_IDS, _INVALID_IDS) for s in pair]
+        results = EUVATId.validate_many(iter(mixed))
+        self.assertEqual(len(results), len(mixed))
+        for s, res in zip(mixed, results):
+            try:
+                EUVATId(s)
+            except ValueError:
+                self.assertIsNotNone(res, s)
+            else:
+                self.assertIsNone(res, s)
+        self.assertEqual(
+            EUVATId.validate_many([' de136695976 ', 5, 'XX1234567',
+                                   'DE13669597', 'DE136695977',
+                                   'pt123456789', None, '']),
+            [None, 'type', 'prefix', 'format', 'check_digit', None, 'type',
+             'prefix'])
+        self.assertEqual(EUVATId.validate_many([]), [])
+        self.assertEqual(EUVATId._validate('DE136695977'), 'check_digit')
+
+    def test_error(self):
+        for s, kind, rule_idx in (('XX1234567', 'prefix', None),
+                                  ('BG12345678', 'format', None),
+                                  ('BG123456787', 'check_digit', 0),
+                                  ('BG7523169264', 'check_digit', 1)):
+            with self.assertRaises(IdentifierError) as cm:
+                EUVATId(s)
+            exc = cm.exception
+            self.assertEqual((exc.kind, exc.country_code, exc.rule_idx),
+                             (kind, s[:2], rule_idx), s)
+            self.assertIn(s[:2] if kind == 'prefix' else s[2:], str(exc))
+        with self.assertRaises(IdentifierError) as cm:
+            EUVATId('BG12345678')
+        self.assertIn(_VAT_ID_RULES['BG'][1][0].pattern, str(cm.exception))
+
     def test_str(self):
         s = _VALID_IDS[0]
         self.assertEqual(str(EUVATId(s)), s)
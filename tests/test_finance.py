@@ -17,8 +17,17 @@
 """Test driver for module finance"""
 
 
+from random import Random
+from string import ascii_letters, digits
 import unittest
 from identifiers.finance import MIC, ISIN
+from identifiers.identifier import IdentifierError
+from identifiers.luhn import luhn, luhn_array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class MICTest(unittest.TestCase):
@@ -94,6 +103,21 @@ class ISINTest(unittest.TestCase):
         isin = ISIN(*args)
         self.assertEqual(isin._id, 'JO000AVH3022')
 
+    def test_validate_many(self):
+        self.assertEqual(ISIN.validate_many(['US0378331005', 'US0378331006',
+                                             'XX0378331005', 'US03783310']),
+                         [None, 'check_digit', 'prefix', 'length'])
+        self.assertEqual(ISIN.validate_many(['US03783310#5', 'USO37833lOO5',
+                                             'US03783310Ä5']),
+                         ['format', 'format', 'format'])
+
+    def test_invalid_chars(self):
+        for args in (('US03783310#5',), ('US', '0378331#0')):
+            with self.assertRaises(IdentifierError) as cm:
+                ISIN(*args)
+            self.assertEqual(cm.exception.kind, 'format')
+            self.assertEqual(cm.exception.country_code, 'US')
+
     def test_elements(self):
         isin = ISIN('JO000AVH3022')
         self.assertEqual(isin.country_code, 'JO')
@@ -101,6 +125,37 @@ class ISINTest(unittest.TestCase):
         self.assertEqual(isin.check_digit, '2')
         self.assertEqual(isin.elements(), ('JO', '000AVH302', '2'))
 
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_check_digits_array(self):
+        isins = ['JOCB9VHDUE67', 'JOCB9VHDUE64', 'JU11CBJO0010',
+                 'JOCBAVHDUE643', 'JOCBAVHDUE6', 'JOCBAVHdue64',
+                 'JOCB9VHDUE6:', 'JO000AVH3022']
+        valid, check_digits = ISIN.check_digits_array(isins)
+        self.assertEqual(valid.tolist(), [True, False, False, False, False,
+                                          False, False, True])
+        self.assertEqual(check_digits[[0, 1, 5, 7]].tolist(), [7, 7, -1, 2])
+        chars = np.frombuffer(b'JOCB9VHDUE67JO000AVH3022', dtype=np.uint8)
+        valid, check_digits = ISIN.check_digits_array(chars.reshape(2, 12))
+        self.assertEqual(valid.tolist(), [True, True])
+        self.assertRaises(TypeError, ISIN.check_digits_array, [[1.5]])
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_luhn_array(self):
+        rnd = Random(4711)
+        alphabet = digits + ascii_letters + '#'
+        strings = [''.join(rnd.choice(alphabet)
+                           for _ in range(rnd.randrange(15)))
+                   for _ in range(3000)]
+        for num_only in (False, True):
+            for allow_lower_case in (False, True):
+                check_digits = luhn_array(strings, num_only, allow_lower_case)
+                for string, check_digit in zip(strings, check_digits):
+                    try:
+                        expected = luhn(string, num_only, allow_lower_case)
+                    except ValueError:
+                        expected = -1
+                    self.assertEqual(check_digit, expected)
+
     def test_str(self):
         isin = ISIN('JOCB9VHDUE67')
         self.assertEqual(str(isin), 'JOCB9VHDUE67')
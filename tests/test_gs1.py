@@ -17,8 +17,247 @@
 """Test driver for module gs1"""
 
 
+import os
+from random import Random
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from threading import Thread
 import unittest
+from identifiers import gs1utils
+from identifiers.gs1 import GS1NumericalIdentifier
 from identifiers.gs1 import GLN, GSIN, GTIN12, GTIN13, GTIN14, SSCC
+from identifiers.identifier import IdentifierError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class GS1UtilsTest(unittest.TestCase):
+
+    def setUp(self):
+        # force reloading of the prefix table
+        gs1utils._prefix_table = None
+
+    def test_preload(self):
+        gs1utils.preload()
+        prefix_list = gs1utils._prefix_table
+        self.assertIsNotNone(prefix_list)
+        gs1utils.preload()
+        self.assertIs(gs1utils._prefix_table, prefix_list)
+
+    def test_lazy_load(self):
+        results = []
+        threads = [Thread(target=lambda: results.append(
+            gs1utils.lookup_company_prefix('570019123456')))
+            for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [7] * 8)
+        self.assertIsNotNone(gs1utils._prefix_table)
+
+    def test_compiled_table(self):
+        with TemporaryDirectory() as tmp_dir:
+            xml_file = os.path.join(tmp_dir, 'prefixes.xml')
+            with open(gs1utils.file_name, 'rb') as src, \
+                    open(xml_file, 'wb') as dst:
+                dst.write(src.read())
+            source = gs1utils._XMLSource(xml_file)
+            cache_file = os.path.join(tmp_dir, 'prefixes.bin')
+            self.assertEqual(gs1utils.compile_prefix_table(
+                xml_file, cache_file=cache_file), cache_file)
+            buf = gs1utils._read_prefix_table(cache_file, source)
+            self.assertIsNotNone(buf)
+            # matching size and modification time: XML file is not hashed
+            source = gs1utils._XMLSource(xml_file)
+            self.assertIsNotNone(gs1utils._read_prefix_table(cache_file,
+                                                             source))
+            self.assertIsNone(source._digest)
+            # XML file touched, but unchanged: digest is compared
+            stat = os.stat(xml_file)
+            os.utime(xml_file, ns=(stat.st_atime_ns,
+                                   stat.st_mtime_ns + 10 ** 9))
+            source = gs1utils._XMLSource(xml_file)
+            self.assertIsNotNone(gs1utils._read_prefix_table(cache_file,
+                                                             source))
+            self.assertIsNotNone(source._digest)
+            self.assertFalse(gs1utils._stamp_matches(buf, source))
+            self.assertTrue(gs1utils._stamp_matches(
+                gs1utils._restamp(buf, source), source))
+            # outdated file must be ignored
+            with open(xml_file, 'ab') as dst:
+                dst.write(b'\n')
+            self.assertIsNone(gs1utils._read_prefix_table(
+                cache_file, gs1utils._XMLSource(xml_file)))
+            # corrupt file must be ignored
+            with open(cache_file, 'wb') as file:
+                file.write(buf[:10])
+            self.assertIsNone(gs1utils._read_prefix_table(cache_file,
+                                                          source))
+        table = gs1utils._PrefixTable(buf)
+        for prefix, cp_length in gs1utils._load_prefix_list():
+            self.assertEqual(table.find(prefix.ljust(12, '0')),
+                             (prefix, cp_length))
+            self.assertEqual(table.find_bisect(prefix.ljust(12, '9')),
+                             (prefix, cp_length))
+        for find in (table.find, table.find_bisect):
+            self.assertIsNone(find(''))
+            self.assertIsNone(find('05'))
+            self.assertIsNone(find('57x019123456'))
+
+    def test_load_restamps(self):
+        saved = gs1utils.file_name, gs1utils.cache_file_name
+        with TemporaryDirectory() as tmp_dir:
+            xml_file = os.path.join(tmp_dir, 'prefixes.xml')
+            with open(gs1utils.file_name, 'rb') as src, \
+                    open(xml_file, 'wb') as dst:
+                dst.write(src.read())
+            cache_file = os.path.join(tmp_dir, 'prefixes.bin')
+            gs1utils.compile_prefix_table(xml_file, cache_file)
+            stat = os.stat(xml_file)
+            os.utime(xml_file, ns=(stat.st_atime_ns,
+                                   stat.st_mtime_ns + 10 ** 9))
+            gs1utils.file_name, gs1utils.cache_file_name = xml_file, cache_file
+            try:
+                for backend in gs1utils.BACKENDS:
+                    gs1utils._load_prefix_table(backend)
+                    with open(cache_file, 'rb') as file:
+                        buf = file.read()
+                    self.assertTrue(gs1utils._stamp_matches(
+                        buf, gs1utils._XMLSource(xml_file)))
+            finally:
+                gs1utils.file_name, gs1utils.cache_file_name = saved
+
+    def test_trie_vs_bisect(self):
+        gs1utils.preload()
+        table = gs1utils._prefix_table
+        rnd = Random(4711)
+        for _ in range(20000):
+            gs1_num_id = str(rnd.randrange(10 ** 13)).zfill(13)
+            self.assertEqual(table.find(gs1_num_id),
+                             table.find_bisect(gs1_num_id))
+
+    def test_company_prefix_cache(self):
+        cache = gs1utils.company_prefix_cache
+        maxsize = cache.maxsize
+        cache.clear()
+        try:
+            self.assertIsNone(cache.hit_rate())
+            # identifiers sharing the leading digits hit the same entry
+            for gs1_num_id in ('570019123456', '570019100000',
+                               '5700191999999'):
+                self.assertEqual(gs1utils.lookup_company_prefix(gs1_num_id),
+                                 7)
+            self.assertEqual(cache.info()[:2], (2, 1))
+            self.assertAlmostEqual(cache.hit_rate(), 2 / 3)
+            # results depending on more digits are not cached
+            self.assertEqual(
+                gs1utils.find_company_prefix('000004901234'),
+                ('00000490', 12))
+            self.assertEqual(
+                gs1utils.find_company_prefix('000004911234'),
+                ('00000491', 12))
+            self.assertEqual(cache.info().currsize, 1)
+            self.assertRaises(ValueError, gs1utils.lookup_company_prefix,
+                              '020123456789')
+            self.assertRaises(ValueError, gs1utils.lookup_company_prefix,
+                              '020123456789')
+            self.assertRaises(ValueError, gs1utils.lookup_company_prefix,
+                              '5700a')
+            cache.resize(1)
+            self.assertEqual(cache.maxsize, 1)
+            self.assertEqual(cache.info().currsize, 0)
+            self.assertRaises(ValueError, cache.resize, -1)
+            table = gs1utils._get_prefix_table()
+            rnd = Random(4711)
+            for _ in range(20000):
+                gs1_num_id = str(rnd.randrange(10 ** 13)).zfill(13)
+                self.assertEqual(gs1utils.find_company_prefix(gs1_num_id),
+                                 table.find(gs1_num_id))
+                # repeat with cached entry
+                self.assertEqual(gs1utils.find_company_prefix(gs1_num_id),
+                                 table.find(gs1_num_id))
+            self.assertEqual(cache.info().currsize, 1)
+        finally:
+            cache.resize(maxsize)
+
+    def test_backends(self):
+        self.assertEqual(gs1utils.get_backend(), 'memory')
+        self.assertRaises(ValueError, gs1utils.set_backend, 'disk')
+        gs1utils.set_backend('mmap')
+        try:
+            self.assertEqual(gs1utils.get_backend(), 'mmap')
+            self.assertEqual(
+                gs1utils.lookup_company_prefix('570019123456'), 7)
+            self.assertRaises(ValueError, gs1utils.lookup_company_prefix,
+                              '050123456789')
+            self.assertEqual(GLN('570019123456')._id, '5700191234561')
+        finally:
+            gs1utils.set_backend('memory')
+        self.assertIsNone(gs1utils._prefix_table)
+
+    def test_backend_from_env(self):
+        code = "from identifiers import gs1utils; " \
+               "print(gs1utils.get_backend())"
+        env = dict(os.environ, IDENTIFIERS_GS1_BACKEND='mmap')
+        res = subprocess.run([sys.executable, '-c', code], env=env,
+                             check=True, stdout=subprocess.PIPE,
+                             universal_newlines=True)
+        self.assertEqual(res.stdout.strip(), 'mmap')
+        env['IDENTIFIERS_GS1_BACKEND'] = 'mmapp'
+        res = subprocess.run([sys.executable, '-c', code], env=env,
+                             stderr=subprocess.PIPE, universal_newlines=True)
+        self.assertNotEqual(res.returncode, 0)
+        self.assertIn("ValueError: Unknown backend: 'mmapp'", res.stderr)
+
+    def test_calc_check_digit(self):
+        for digits, check_digit in (('570019123456', '1'),
+                                    ('07712345678', '6'),
+                                    ('4077123456789', '5'),
+                                    ('0771234567890123', '3'),
+                                    ('70771234567890123', '2'),
+                                    ('', '0'),
+                                    ('1' * 20, '0'),
+                                    ('٥٧٠٠١٩١٢٣٤٥٦', '1')):
+            self.assertEqual(gs1utils.calc_check_digit(digits), check_digit)
+        self.assertRaises(ValueError, gs1utils.calc_check_digit, '57001912a')
+        rnd = Random(4711)
+        for _ in range(1000):
+            digits = str(rnd.randrange(10 ** 17)).zfill(rnd.randrange(18))
+            ints = [int(d) for d in reversed(digits)]
+            checksum = 3 * sum(ints[::2]) + sum(ints[1::2])
+            self.assertEqual(gs1utils.calc_check_digit(digits),
+                             str(-checksum % 10))
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_check_digits_array(self):
+        codes = np.array(['5700191234561', '5700191234562'], dtype='S13')
+        valid, check_digits = gs1utils.check_digits_array(codes)
+        self.assertEqual(valid.tolist(), [True, False])
+        self.assertEqual(check_digits.tolist(), [1, 1])
+        codes = ['077123456786', '5700191234561', '40771234567895',
+                 '57001912345678', '5700191234x61', '1', '']
+        valid, check_digits = gs1utils.check_digits_array(codes)
+        self.assertEqual(valid.tolist(),
+                         [True, True, True, False, False, False, False])
+        self.assertEqual(check_digits.tolist(), [6, 1, 5, 6, -1, -1, -1])
+        valid, check_digits = gs1utils.check_digits_array(
+            np.array(codes[:6], dtype='S14').reshape(2, 3))
+        self.assertEqual(valid.tolist(),
+                         [[True, True, True], [False, False, False]])
+        self.assertRaises(TypeError, gs1utils.check_digits_array, [1, 2])
+        rnd = Random(4711)
+        codes = [str(rnd.randrange(10 ** 17)).zfill(rnd.choice((13, 18)))
+                 for _ in range(1000)]
+        valid, check_digits = gs1utils.check_digits_array(codes)
+        for code, is_valid, check_digit in zip(codes, valid, check_digits):
+            expected = GS1NumericalIdentifier.calc_check_digit(code[:-1])
+            self.assertEqual(str(check_digit), expected)
+            self.assertEqual(is_valid, code[-1] == expected)
 
 
 class GS1NumericalIdentifierTest(unittest.TestCase):
@@ -73,6 +312,25 @@ class GS1NumericalIdentifierTest(unittest.TestCase):
         gln = GLN('5700191', '23456')
         self.assertEqual(gln._id, '5700191234561')
 
+    def test_validate_many(self):
+        args = ['5700191234561', '570019123456', 5700191234561,
+                '570019-123456-1', '57001912345619', '57001912345',
+                '050123456789', '569789123456', '5700191234567']
+        self.assertEqual(GLN.validate_many(args),
+                         [None, None, 'type', 'format', 'length', 'length',
+                          'excluded_prefix', 'prefix', 'check_digit'])
+        self.assertEqual(GLN.validate_many(iter(args[:2])), [None, None])
+
+    def test_prefix_errors(self):
+        for arg, kind, msg in (
+                ('050123456789', 'excluded_prefix',
+                 "Excluded prefix: '050'."),
+                ('569789123456', 'prefix', "Undefined prefix.")):
+            with self.assertRaises(IdentifierError) as cm:
+                GLN(arg)
+            self.assertEqual(cm.exception.kind, kind)
+            self.assertEqual(str(cm.exception), msg)
+
     def test_str(self):
         self.assertEqual(str(GLN('5700191234561')), '5700191234561')
 
@@ -141,6 +399,19 @@ class GTIN13_Test(unittest.TestCase):
         self.assertEqual(gtin.check_digit, '6')
         self.assertEqual(gtin.elements(), ('377912345678', '', '6'))
 
+    def test_from_trusted(self):
+        for arg in ('5700271234566', '377912345678', '4012345678901'):
+            gtin = GTIN13(arg)
+            trusted = GTIN13.from_trusted(gtin._id)
+            self.assertEqual(trusted, gtin)
+            self.assertIsNone(trusted._ref_idx)
+            self.assertRaises(AttributeError, getattr, trusted, '_ref_idx_')
+            self.assertEqual(trusted.elements(), gtin.elements())
+            self.assertEqual(trusted._ref_idx, gtin._ref_idx)
+            self.assertEqual(GTIN14(trusted), GTIN14(gtin))
+        gtin = GTIN14.from_trusted('04012345678901')
+        self.assertEqual(gtin.elements(), ('0', '4012345', '67890', '1'))
+
     def test_separated(self):
         gtin = GTIN13('5700271234566')
         self.assertEqual(gtin.separated(), '5700271-23456-6')
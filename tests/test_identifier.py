@@ -19,9 +19,13 @@
 
 from abc import ABCMeta
 from copy import copy, deepcopy
+import pickle
+import subprocess
+import sys
 import unittest
 from uuid import uuid1
-from identifiers.identifier import Identifier
+import identifiers
+from identifiers.identifier import Identifier, IdentifierError
 
 
 class Id(Identifier):
@@ -38,6 +42,16 @@ class Id2(Id):
     pass
 
 
+class IntId(Id):
+
+    def __init__(self, id):
+        if not isinstance(id, str):
+            raise TypeError
+        if id.startswith('-'):
+            raise IdentifierError('format', "Must not be negative.")
+        self._id = int(id)
+
+
 class IdentifierTest(unittest.TestCase):
 
     # Use concrete classes 'Id' and 'Id2' to test common features implemented
@@ -64,6 +78,39 @@ class IdentifierTest(unittest.TestCase):
         for arg1, arg2 in self.zipped_args:
             self.assertEqual(hash(Id(arg1)), hash(Id(arg1)))
             self.assertNotEqual(hash(Id(arg1)), hash(Id(arg2)))
+        id = Id('abcde')
+        id2 = pickle.loads(pickle.dumps(id))
+        self.assertEqual(id2, id)
+        self.assertEqual(hash(id2), hash(id))
+
+    def test_validate_many(self):
+        self.assertEqual(IntId.validate_many(['17', 5, 'a', '-3']),
+                         [None, 'type', 'invalid', 'format'])
+
+    def test_identifier_error(self):
+        calls = []
+
+        def render():
+            calls.append(1)
+            return "Wrong check digit."
+
+        exc = IdentifierError('check_digit', render, 'DE', 2)
+        self.assertIsInstance(exc, ValueError)
+        self.assertEqual((exc.kind, exc.country_code, exc.rule_idx),
+                         ('check_digit', 'DE', 2))
+        # message rendered on first use only
+        self.assertEqual(calls, [])
+        self.assertEqual(str(exc), "Wrong check digit.")
+        self.assertEqual(str(exc), "Wrong check digit.")
+        self.assertEqual(calls, [1])
+        exc2 = pickle.loads(pickle.dumps(IdentifierError('prefix', render)))
+        self.assertEqual((exc2.kind, str(exc2), exc2.country_code,
+                          exc2.rule_idx),
+                         ('prefix', "Wrong check digit.", None, None))
+        self.assertEqual(str(IdentifierError('format', "Invalid.")),
+                         "Invalid.")
+        exc = IdentifierError('format', lambda: "Invalid.")
+        self.assertEqual(repr(exc), "IdentifierError('format', 'Invalid.')")
 
     def test_eq(self):
         for arg in self.test_args:
@@ -71,3 +118,82 @@ class IdentifierTest(unittest.TestCase):
         for arg1, arg2 in self.zipped_args:
             self.assertEqual(Id(arg1), Id(arg1))
             self.assertNotEqual(Id(arg1), Id(arg2))
+        self.assertNotEqual(Id('abc'), 'abc')
+        self.assertIs(Id('abc').__eq__('abc'), NotImplemented)
+
+    def test_ordering(self):
+        ids = [Id(arg) for arg in ('b', 'abc', 'a', 'c', 'b')]
+        self.assertEqual([str(id) for id in sorted(ids)],
+                         ['a', 'abc', 'b', 'b', 'c'])
+        self.assertTrue(Id('a') < Id('b') <= Id('b') < Id('c'))
+        self.assertTrue(Id('c') > Id('b') >= Id('b') > Id('a'))
+        self.assertFalse(Id('b') < Id('b'))
+        for other in (Id2('b'), 'b', 5):
+            self.assertIs(Id('a').__lt__(other), NotImplemented)
+            self.assertRaises(TypeError, lambda: Id('a') < other)
+            self.assertRaises(TypeError, lambda: Id('a') >= other)
+
+    def test_interning(self):
+        self.assertIsNone(IntId.interning_info())
+        self.assertIsNot(IntId.interned('17'), IntId.interned('17'))
+        self.assertRaises(ValueError, IntId.enable_interning, 0)
+        IntId.enable_interning(2)
+        try:
+            id = IntId.interned('17')
+            self.assertIs(IntId.interned('17'), id)
+            self.assertEqual(IntId.interning_info()[:2], (1, 1))
+            # calling the class always creates a new instance
+            self.assertIsNot(IntId('17'), id)
+            # only str args are interned, invalid args are not cached
+            self.assertRaises(TypeError, IntId.interned, 17)
+            self.assertRaises(ValueError, IntId.interned, 'x')
+            self.assertRaises(ValueError, IntId.interned, 'x')
+            self.assertEqual(IntId.interning_info()[:2], (1, 3))
+            # LRU eviction
+            IntId.interned('18')
+            IntId.interned('19')
+            self.assertEqual(IntId.interning_info().currsize, 2)
+            self.assertIsNot(IntId.interned('17'), id)
+
+            # interning is not inherited
+            class SubIntId(IntId):
+                __slots__ = ()
+
+            self.assertIsNone(SubIntId.interning_info())
+            self.assertIsNot(SubIntId.interned('17'),
+                             SubIntId.interned('17'))
+            self.assertIs(type(SubIntId.interned('17')), SubIntId)
+            SubIntId.disable_interning()
+            self.assertIsNotNone(IntId.interning_info())
+        finally:
+            IntId.disable_interning()
+        self.assertIsNone(IntId.interning_info())
+        self.assertIsNot(IntId.interned('17'), IntId.interned('17'))
+        IntId.disable_interning()
+
+    def test_from_trusted(self):
+        self.assertRaises(TypeError, Identifier.from_trusted, 'a')
+        id = IntId.from_trusted('abc')
+        self.assertIs(type(id), IntId)
+        self.assertEqual(id._id, 'abc')
+        self.assertEqual(IntId.from_trusted(17), IntId('17'))
+
+
+class PackageTest(unittest.TestCase):
+
+    def test_lazy_import(self):
+        code = ("import sys; from identifiers import EUVATId; "
+                "print(sorted(m for m in sys.modules "
+                "if m.startswith('identifiers.')))")
+        res = subprocess.run([sys.executable, '-c', code], check=True,
+                             stdout=subprocess.PIPE, universal_newlines=True)
+        # the registries of the other identifiers must not be loaded
+        self.assertEqual(res.stdout.strip(),
+                         "['identifiers.dateutils', 'identifiers.euvatid', "
+                         "'identifiers.identifier', 'identifiers.version']")
+
+    def test_attrs(self):
+        for name in identifiers.__all__:
+            self.assertIn(name, dir(identifiers))
+            self.assertEqual(getattr(identifiers, name).__name__, name)
+        self.assertRaises(AttributeError, getattr, identifiers, 'ISSN13')